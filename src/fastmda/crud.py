@@ -1,6 +1,7 @@
 import json
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from sqlalchemy import case, text, update
 from sqlalchemy.orm import Session
 
 from fastmda import models, schemas
@@ -10,8 +11,52 @@ def get_device_infos(db: Session, skip: int = 0, limit: int = 100) -> List[model
     return db.query(models.DeviceInfo).offset(skip).limit(limit).all()
 
 
+def iter_all_device_types(db: Session, batch_size: int = 200) -> Iterator[Tuple[int, str]]:
+    return db.query(models.DeviceInfo.id, models.DeviceInfo.device_type).yield_per(batch_size)
+
+
+def get_devices_args(db: Session, device_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    return dict(db.query(models.DeviceInfo.id, models.DeviceInfo.args).filter(models.DeviceInfo.id.in_(device_ids)))
+
+
+def get_pickled_device_ids(db: Session) -> List[int]:
+    """
+    Gets the IDs of the devices whose arguments are still stored as pickled blobs by older versions. The JSON args
+    column cannot read those rows until they are converted with `python -m fastmda.upgrade_db`.
+
+    :param db: The database session.
+    :type db: Session
+    :return: The IDs of the devices with pickled arguments.
+    :rtype: List[int]
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return []
+    return list(db.execute(text("SELECT id FROM device_info WHERE typeof(args) = 'blob'")).scalars())
+
+
+def get_pickled_device_args(db: Session) -> List[Tuple[int, bytes]]:
+    """
+    Gets the pickled arguments of the devices whose arguments are still stored as pickled blobs by older versions.
+
+    :param db: The database session.
+    :type db: Session
+    :return: A list of the (device ID, pickled arguments) of the devices with pickled arguments.
+    :rtype: List[Tuple[int, bytes]]
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return []
+    # Read the raw column since the JSON type fails to decode the pickled blobs.
+    return [(device_id, bytes(args)) for device_id, args in
+            db.execute(text("SELECT id, args FROM device_info WHERE typeof(args) = 'blob'"))]
+
+
+def update_device_args(db: Session, device_id: int, args: Dict[str, Any]) -> None:
+    db.query(models.DeviceInfo).filter(models.DeviceInfo.id == device_id).update({models.DeviceInfo.args: args})
+    db.commit()
+
+
 def get_device_info(db: Session, device_id: int) -> models.DeviceInfo:
-    return db.query(models.DeviceInfo).filter(models.DeviceInfo.id == device_id).first()
+    return db.get(models.DeviceInfo, device_id)
 
 
 def create_device_info(db: Session, device_info: schemas.DeviceInfoCreate) -> models.DeviceInfo:
@@ -22,11 +67,31 @@ def create_device_info(db: Session, device_info: schemas.DeviceInfoCreate) -> mo
     return db_device_info
 
 
-def update_device_connection_status(db: Session, device_id: int, connection_status: bool):
-    device_info = get_device_info(db, device_id)
-    if device_info is not None:
-        device_info.is_connected = connection_status
+def update_device_connection_status(db: Session, device_id: int,
+                                    connection_status: bool) -> Optional[models.DeviceInfo]:
+    if not getattr(db.get_bind().dialect, "update_returning", False):
+        db.query(models.DeviceInfo).filter(models.DeviceInfo.id == device_id).update(
+            {models.DeviceInfo.is_connected: connection_status}
+        )
         db.commit()
-        return device_info
-    else:
-        return None
+        return get_device_info(db, device_id)
+    # Read the updated row in the same statement, and detach it so that the commit does not expire it.
+    db_device_info = db.execute(
+        update(models.DeviceInfo).where(models.DeviceInfo.id == device_id).values(is_connected=connection_status)
+        .returning(models.DeviceInfo)
+    ).scalar_one_or_none()
+    if db_device_info is not None:
+        db.expunge(db_device_info)
+    db.commit()
+    return db_device_info
+
+
+def update_devices_connection_status(db: Session, connection_statuses: Dict[int, bool]) -> int:
+    if not connection_statuses:
+        return 0
+    updated_rows = db.query(models.DeviceInfo).filter(models.DeviceInfo.id.in_(connection_statuses)).update(
+        {models.DeviceInfo.is_connected: case(connection_statuses, value=models.DeviceInfo.id)},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated_rows
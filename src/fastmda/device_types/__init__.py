@@ -0,0 +1,95 @@
+import importlib
+import logging
+import sys
+from pkgutil import iter_modules
+from types import ModuleType
+from typing import Dict, Type
+
+from fastmda.exceptions import FastMDAImplementationError, FastMDAModuleError
+from fastmda.globals import device_types_info, device_types_classes
+from fastmda.objects import AbstractDevice
+from fastmda.schemas import DeviceType
+
+logger = logging.getLogger(__name__)
+
+def _cached_import(module_name: str) -> ModuleType:
+    """
+    Help function for importing a module which returns the module from sys.modules directly if it is already imported.
+
+    :param module_name: The full name of the module to import.
+    :type module_name: str
+    :return: The imported module.
+    :rtype: ModuleType
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+def load_device_type(device_type: str) -> Type[AbstractDevice]:
+    """
+    Function for importing and registering the Device class of a device type. The module is only imported the first
+    time the device type is used, after that the registered Device class is returned.
+
+    :param device_type: The name of the device type, i.e. the name of the device type sub package.
+    :type device_type: str
+    :return: The Device class of the device type.
+    :rtype: Type[AbstractDevice]
+    :raises FastMDAModuleError: If there is no module for the device type.
+    :raises FastMDAImplementationError: If the module does not implement the Device class according to spec.
+    """
+    device_class = device_types_classes.get(device_type)
+    if device_class is not None:
+        return device_class
+    module_name = f"{__name__}.{device_type}.{device_type}"
+    try:
+        device_module = _cached_import(module_name)
+    except ModuleNotFoundError:
+        raise FastMDAModuleError(module_name)
+    try:
+        device_class = device_module.Device
+        # Prefer the module level DEVICE_TYPE constant which avoids calling the device_type method.
+        device_type_info = getattr(device_module, "DEVICE_TYPE", None)
+        if device_type_info is None:
+            device_type_info = device_class.device_type()
+    except AttributeError:
+        raise FastMDAImplementationError(device_module, "Does not subclass AbstractDevice.")
+    except TypeError as e:
+        raise FastMDAImplementationError(device_module, str(e))
+    # Intern the registry keys so that lookups with interned device type strings compare by identity.
+    device_type = sys.intern(device_type)
+    device_types_info[device_type] = device_type_info
+    device_types_classes[device_type] = device_class
+    return device_class
+
+
+def load_all_device_types() -> Dict[str, DeviceType]:
+    """
+    Function for importing and registering all the available device types. Device types that fail to load are logged
+    and skipped.
+
+    :return: A dictionary of the device type information of all the device types that could be loaded.
+    :rtype: Dict[str, DeviceType]
+    """
+    for device_module_info in iter_modules(__path__):
+        try:
+            load_device_type(device_module_info.name)
+        except (FastMDAModuleError, FastMDAImplementationError) as e:
+            logger.warning("Skipping device type %s: %s", device_module_info.name, e)
+    return device_types_info
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Lazy (PEP 562) access to the device type sub packages, e.g. `fastmda.device_types.example_device` imports and
+    registers the example_device device type on first access. After that the sub package is found as a regular
+    attribute of the package.
+    """
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        load_device_type(name)
+    except FastMDAModuleError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return sys.modules[f"{__name__}.{name}"]
@@ -1,5 +1,7 @@
+from __future__ import annotations
 import asyncio
-from typing import List, Dict, Union, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Union, Tuple
 
 from fastmda import schemas
 from fastmda.exceptions import FastMDAConnectFailed
@@ -7,35 +9,45 @@ from fastmda.objects import AbstractDevice, DiscreteActuator, ContinuousActuator
     ContinuousSetting
 from fastmda.schemas import DeviceType
 
+DEVICE_TYPE = DeviceType(name="Example device",
+                          device_description="An example of how to implement a device",
+                          args={
+                              "com_port": "COM port on which the device is located (as an example)"
+                          })
+_EMPTY = MappingProxyType({})
+
 
 class MyActuator(DiscreteActuator):
 
+    __slots__ = ('_position', '_position_values', '_unit', '_settings')
+
     def __init__(self, actuator_id, parent):
         super().__init__(actuator_id=actuator_id, parent=parent)
         self._position = 0
         self._position_values = ["off", "on"]
         self._unit = schemas.Unit()
-        self._settings = {1: DelaySetting(1, self)}
+        self._settings = MappingProxyType({1: DelaySetting(1, self)})
 
     @property
     def name(self) -> str:
         return f"My actuator number {self.actuator_id}"
 
     @property
-    def settings(self) -> Dict[int, Union[DiscreteSetting, ContinuousSetting]]:
+    def settings(self) -> Mapping[int, Union[DiscreteSetting, ContinuousSetting]]:
         return self._settings
 
     async def get_value(self) -> str:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return self._position_values[self._position]
 
     def get_value_options(self) -> List[str]:
         return self._position_values
 
-    async def _set_value(self, value_index: int):
+    async def _set_value(self, value_index: int) -> str:
         self._position = value_index
         wait_time = await self._settings[1].get_value()
         await asyncio.sleep(wait_time)
+        return self._position_values[value_index]
 
     @property
     def unit(self) -> schemas.Unit:
@@ -47,31 +59,29 @@ class MyActuator(DiscreteActuator):
 
 class Device(AbstractDevice):
 
+    __slots__ = ('com_port', '_is_connected', '_actuators')
+
     @staticmethod
     def device_type():
-        return DeviceType(name="Example device",
-                          device_description="An example of how to implement a device",
-                          args={
-                              "com_port": "COM port on which the device is located (as an example)"
-                          })
+        return DEVICE_TYPE
 
     def __init__(self, device_id: int, com_port: str):
         self.com_port = com_port
         self._is_connected = False
         super().__init__(device_id=device_id)
-        self._actuators = {1: MyActuator(1, self)}
+        self._actuators = MappingProxyType({1: MyActuator(1, self)})
 
     @property
-    def detectors(self) -> Dict[int, Detector]:
-        return {}
+    def detectors(self) -> Mapping[int, Detector]:
+        return _EMPTY
 
     @property
-    def actuators(self) -> Dict[int, Union[DiscreteActuator, ContinuousActuator]]:
+    def actuators(self) -> Mapping[int, Union[DiscreteActuator, ContinuousActuator]]:
         return self._actuators
 
     @property
-    def settings(self) -> Dict[int, Union[DiscreteSetting, ContinuousSetting]]:
-        return {}
+    def settings(self) -> Mapping[int, Union[DiscreteSetting, ContinuousSetting]]:
+        return _EMPTY
 
     def connect(self) -> bool:
         if self.com_port == "COM1":
@@ -91,6 +101,8 @@ class Device(AbstractDevice):
 
 class DelaySetting(ContinuousSetting):
 
+    __slots__ = ('_hard_limits', '_wait_time', '_name', '_unit')
+
     def __init__(self, setting_id: int, parent: Union[AbstractDevice, DiscreteActuator, ContinuousActuator, Detector]):
         super().__init__(setting_id, parent)
         self._hard_limits = (0., 1e3)
@@ -104,8 +116,9 @@ class DelaySetting(ContinuousSetting):
     async def get_value(self) -> float:
         return self._wait_time
 
-    async def _set_value(self, value: float):
+    async def _set_value(self, value: float) -> float:
         self._wait_time = value
+        return self._wait_time
 
     @property
     def name(self) -> str:
@@ -1,13 +1,50 @@
 from types import ModuleType
+from typing import Any, Callable, Optional, Tuple
 
 from fastmda.schemas import ActuatorInfo, DeviceType, SettingInfo
 
+# Message templates shared by the exceptions of the same family.
+_CONNECTION_FAILED_MESSAGE = 'The {device.name} device with id {device_id} failed to {action}. {detail}'
+_ACTUATOR_LIMIT_MESSAGE = 'Actuator {info.name} with id {info.actuator_id} of device {info.device_id} at {limit} ' \
+                          'limit. {detail}'
+_SETTING_LIMIT_MESSAGE = 'Setting {info.name} with ID {info.setting_id} with parent ID {info.parent_id} ' \
+                         '(with possible grandparent ID {info.grandparent_id}) at {limit} limit. {detail}'
+
+
+def _check_info_arguments(info: object, info_factory: object, info_name: str) -> None:
+    """
+    Help function for checking that exactly one of the info object and the info factory of a limit exception is given,
+    so that the message of the exception can always be formatted.
+
+    :param info: The info object argument.
+    :type info: object
+    :param info_factory: The info factory argument.
+    :type info_factory: object
+    :param info_name: The name of the info object argument.
+    :type info_name: str
+    :raises TypeError: If none or both of the arguments are given.
+    """
+    if (info is None) == (info_factory is None):
+        raise TypeError(f"Exactly one of {info_name} and {info_name}_factory must be given.")
+
 
 class FastMDAException(Exception):
     """
-    Super class for all FastMDA exceptions
+    Super class for all FastMDA exceptions. The message of the exception is only formatted when it is requested.
     """
-    pass
+
+    @property
+    def message(self) -> str:
+        """
+        Getter method for the message property.
+
+        :return: The full message of the exception.
+        :rtype: str
+        """
+        return super().__str__()
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class FastMDAConnectFailed(FastMDAException):
@@ -26,8 +63,15 @@ class FastMDAConnectFailed(FastMDAException):
         :param message: Detailed message for log
         :type message: str
         """
-        self.message = f'The {device.name} device with id {device_id} failed to connect. {message}'
-        super().__init__(self.message)
+        super().__init__(device, device_id, message)
+        self.device = device
+        self.device_id = device_id
+        self.detail = message
+
+    @property
+    def message(self) -> str:
+        return _CONNECTION_FAILED_MESSAGE.format(device=self.device, device_id=self.device_id, action='connect',
+                                                 detail=self.detail)
 
 
 class FastMDADisconnectFailed(FastMDAException):
@@ -46,8 +90,15 @@ class FastMDADisconnectFailed(FastMDAException):
         :param message: Detailed message for log
         :type message: str
         """
-        self.message = f'The {device.name} device with id {device_id} failed to disconnect. {message}'
-        super().__init__(self.message)
+        super().__init__(device, device_id, message)
+        self.device = device
+        self.device_id = device_id
+        self.detail = message
+
+    @property
+    def message(self) -> str:
+        return _CONNECTION_FAILED_MESSAGE.format(device=self.device, device_id=self.device_id, action='disconnect',
+                                                 detail=self.detail)
 
 
 class FastMDAImplementationError(FastMDAException):
@@ -64,8 +115,13 @@ class FastMDAImplementationError(FastMDAException):
         :param message: Detailed message for log.
         :type message: str
         """
-        self.message = f'{implemented_module.__name__} not implemented according to spec. {message}'
-        super().__init__(self.message)
+        super().__init__(implemented_module, message)
+        self.implemented_module = implemented_module
+        self.detail = message
+
+    @property
+    def message(self) -> str:
+        return f'{self.implemented_module.__name__} not implemented according to spec. {self.detail}'
 
 
 class FastMDAModuleError(FastMDAException):
@@ -82,86 +138,156 @@ class FastMDAModuleError(FastMDAException):
         :param message: Detailed message for log.
         :type message: str
         """
-        self.message = f'No {implemented_module} module found. {message}'
-        super().__init__(self.message)
+        super().__init__(implemented_module, message)
+        self.implemented_module = implemented_module
+        self.detail = message
+
+    @property
+    def message(self) -> str:
+        return f'No {self.implemented_module} module found. {self.detail}'
 
 
-class FastMDAatSoftwareLimit(FastMDAException):
+class _LimitException(FastMDAException):
     """
-    Raised if an actuator is at its software limit.
+    Super class for the exceptions raised if an actuator or a setting is at a limit. The info of the actuator or
+    setting is either given directly or by a factory, which is only called when the info is first needed.
     """
 
-    def __init__(self, actuator_info: ActuatorInfo, message: str = ""):
+    # The name of the info argument and the message template of the subclass, and the limit named in the message.
+    _info_name = 'info'
+    _message_template = '{detail}'
+    _limit = ''
+
+    def __init__(self, info: Optional[Any], message: str, info_factory: Optional[Callable[[], Any]]):
         """
-        Init method for FastMDAatSoftwareLimit exception.
+        Init method for the _LimitException exception.
 
-        :param actuator_info: The ActuatorInfo object of the actuator at the limit.
-        :type actuator_info: ActuatorInfo
+        :param info: The info object of the actuator or setting at the limit.
+        :type info: Optional[Any]
         :param message: Detailed message for log.
         :type message: str
+        :param info_factory: Function returning the info object, called when it is first needed instead of passing
+            info.
+        :type info_factory: Optional[Callable[[], Any]]
+        :raises TypeError: If not exactly one of info and info_factory is given.
         """
-        self.message = f'Actuator {actuator_info.name} with id {actuator_info.actuator_id} of device' + \
-                       f'{actuator_info.device_id} at software limit. {message}'
-        super().__init__(self.message)
+        _check_info_arguments(info, info_factory, self._info_name)
+        super().__init__(info, message)
+        self._info = info
+        self._info_factory = info_factory
+        self.detail = message
+
+    @property
+    def info(self) -> Any:
+        if self._info is None:
+            self._info = self._info_factory()
+            self._info_factory = None
+        return self._info
+
+    @property
+    def args(self) -> Tuple[Any, str]:
+        # Built from the resolved info, since the info passed on to the Exception init is None when a factory is given.
+        return self.info, self.detail
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.info!r}, {self.detail!r})'
+
+    def __reduce__(self):
+        return type(self), self.args
 
+    @property
+    def message(self) -> str:
+        return self._message_template.format(info=self.info, limit=self._limit, detail=self.detail)
 
-class FastMDAatHardwareLimit(FastMDAException):
+
+class _ActuatorLimitException(_LimitException):
     """
-    Raised if an actuator is at its hardware limit.
+    Super class for the exceptions raised if an actuator is at a limit.
     """
 
-    def __init__(self, actuator_info: ActuatorInfo, message: str = ""):
+    _info_name = 'actuator_info'
+    _message_template = _ACTUATOR_LIMIT_MESSAGE
+
+    def __init__(self, actuator_info: Optional[ActuatorInfo] = None, message: str = "",
+                 actuator_info_factory: Optional[Callable[[], ActuatorInfo]] = None):
         """
-        Init method for FastMDAatHardwareLimit exception.
+        Init method for the actuator limit exceptions.
 
-        :param actuator_info: The ActuatorInfo object of the actuator at the limit
+        :param actuator_info: The ActuatorInfo object of the actuator at the limit.
         :type actuator_info: ActuatorInfo
-        :param message: Detailed message for log
+        :param message: Detailed message for log.
         :type message: str
+        :param actuator_info_factory: Function returning the ActuatorInfo object, called when it is first needed instead
+            of passing actuator_info.
+        :type actuator_info_factory: Optional[Callable[[], ActuatorInfo]]
+        :raises TypeError: If not exactly one of actuator_info and actuator_info_factory is given.
         """
-        self.message = f'Actuator {actuator_info.name} with id {actuator_info.actuator_id} of device' + \
-                       f'{actuator_info.device_id} at hardware limit. {message}'
-        super().__init__(self.message)
+        super().__init__(actuator_info, message, actuator_info_factory)
+
+    @property
+    def actuator_info(self) -> ActuatorInfo:
+        return self.info
 
 
-class FastMDAatHardSettingLimit(FastMDAException):
+class _SettingLimitException(_LimitException):
     """
-    Raised if a setting is at its hard limit.
+    Super class for the exceptions raised if a setting is at a limit.
     """
 
-    def __init__(self, setting_info: SettingInfo, message: str = ""):
+    _info_name = 'setting_info'
+    _message_template = _SETTING_LIMIT_MESSAGE
+
+    def __init__(self, setting_info: Optional[SettingInfo] = None, message: str = "",
+                 setting_info_factory: Optional[Callable[[], SettingInfo]] = None):
         """
-        Init method for FastMDAatHardSettingLimit exception.
+        Init method for the setting limit exceptions.
 
-        :param setting_info: The ActuatorType object of the actuator at the limit
-        :type setting_info: ActuatorType
-        :param message: Detailed message for log
+        :param setting_info: The SettingInfo object of the setting at the limit.
+        :type setting_info: SettingInfo
+        :param message: Detailed message for log.
         :type message: str
+        :param setting_info_factory: Function returning the SettingInfo object, called when it is first needed instead
+            of passing setting_info.
+        :type setting_info_factory: Optional[Callable[[], SettingInfo]]
+        :raises TypeError: If not exactly one of setting_info and setting_info_factory is given.
         """
-        self.message = f'Setting {setting_info.name} with ID {setting_info.actuator_id} with parent ID' + \
-                       f'{setting_info.parent_id} (with possible grandparent ID {setting_info.grandparent_id}) ' + \
-                       f'at hard limit. {message}'
-        super().__init__(self.message)
+        super().__init__(setting_info, message, setting_info_factory)
 
+    @property
+    def setting_info(self) -> SettingInfo:
+        return self.info
 
-class FastMDAatSoftSettingLimit(FastMDAException):
+
+class FastMDAatSoftwareLimit(_ActuatorLimitException):
     """
-    Raised if a setting is at its soft limit.
+    Raised if an actuator is at its software limit.
     """
 
-    def __init__(self, setting_info: SettingInfo, message: str = ""):
-        """
-        Init method for FastMDAatSoftSettingLimit exception.
+    _limit = 'software'
 
-        :param setting_info: The ActuatorType object of the actuator at the limit
-        :type setting_info: ActuatorType
-        :param message: Detailed message for log
-        :type message: str
-        """
-        self.message = f'Setting {setting_info.name} with ID {setting_info.actuator_id} with parent ID' + \
-                       f'{setting_info.parent_id} (with possible grandparent ID {setting_info.grandparent_id}) ' + \
-                       f'at soft limit. {message}'
-        super().__init__(self.message)
+
+class FastMDAatHardwareLimit(_ActuatorLimitException):
+    """
+    Raised if an actuator is at its hardware limit.
+    """
+
+    _limit = 'hardware'
+
+
+class FastMDAatHardSettingLimit(_SettingLimitException):
+    """
+    Raised if a setting is at its hard limit.
+    """
+
+    _limit = 'hard'
+
+
+class FastMDAatSoftSettingLimit(_SettingLimitException):
+    """
+    Raised if a setting is at its soft limit.
+    """
+
+    _limit = 'soft'
 
 
 class FastMDAisBusy(FastMDAException):
@@ -178,5 +304,10 @@ class FastMDAisBusy(FastMDAException):
         :param message: Detailed message for log.
         :type message: str
         """
-        self.message = f'Device with ID {device_id} is busy. {message}'
-        super().__init__(self.message)
+        super().__init__(device_id, message)
+        self.device_id = device_id
+        self.detail = message
+
+    @property
+    def message(self) -> str:
+        return f'Device with ID {self.device_id} is busy. {self.detail}'
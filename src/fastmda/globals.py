@@ -9,6 +9,8 @@ from fastmda.schemas import DeviceInfoCreate
 #         }
 #     )
 # }
+__all__ = ['device_dict', 'device_types_info', 'device_types_classes']
+
 device_dict = {}
 device_types_info = {}
-device_types_modules = {}
+device_types_classes = {}
@@ -1,15 +1,18 @@
-import importlib
-import os
-from pkgutil import iter_modules
+import asyncio
+import logging
+import sys
+from typing import Any, Dict, Type
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 
-from fastmda.exceptions import FastMDAImplementationError, FastMDAModuleError
-from fastmda.globals import *
+from fastmda.exceptions import FastMDAImplementationError, FastMDAModuleError, FastMDAisBusy
+from fastmda.globals import device_dict
 from fastmda import models, device_types, crud
 from fastmda.database import engine, SessionLocal
-from fastmda.schemas import DeviceInfo
-from fastmda.routers import devices, actuators, detectors
+from fastmda.objects import AbstractDevice
+from fastmda.routers import devices, actuators, detectors, set_timeout
+
+logger = logging.getLogger(__name__)
 
 description = """
 This is the OpenAPI interface for the fastMDA multi dimensional acquisition server.
@@ -86,43 +89,96 @@ app.include_router(detectors.router)
 models.Base.metadata.create_all(bind=engine)
 
 
+def _instantiate_device(device_class: Type[AbstractDevice], device_id: int,
+                        device_args: Dict[str, Any]) -> AbstractDevice:
+    """
+    Help function for instantiating a device.
+
+    :param device_class: The Device class of the device type.
+    :type device_class: Type[AbstractDevice]
+    :param device_id: The unique ID of the device.
+    :type device_id: int
+    :param device_args: The arguments needed to initialize the Device object.
+    :type device_args: Dict[str, Any]
+    :return: The device instance.
+    :rtype: AbstractDevice
+    :raises FastMDAImplementationError: If the Device class cannot be instantiated with the device arguments.
+    """
+    try:
+        return device_class(device_id, **device_args)
+    except TypeError as e:
+        raise FastMDAImplementationError(sys.modules[device_class.__module__], str(e))
+
+
+def _disconnect_device(device: AbstractDevice) -> bool:
+    """
+    Help function for disconnecting a device at shutdown. An ongoing set, connect or disconnect of the device is waited
+    for (at most as long as a set may take) by acquiring the busy lock of the device.
+
+    :param device: The device to disconnect.
+    :type device: AbstractDevice
+    :return: The success of the disconnection.
+    :rtype: bool
+    :raises FastMDAisBusy: If the device is still busy after the set timeout.
+    """
+    if not device.busy_lock.acquire(timeout=set_timeout):
+        raise FastMDAisBusy(device.device_id, "Not disconnected at shutdown.")
+    try:
+        return device.disconnect()
+    finally:
+        device.busy_lock.release()
+
+
 @app.on_event("startup")
 async def build_device_dict():
-    for device_module_info in iter_modules(device_types.__path__):
-        module_name = f"fastmda.device_types.{device_module_info.name}.{device_module_info.name}"
-        try:
-            device_module = importlib.import_module(module_name)
-        except ModuleNotFoundError:
-            raise FastMDAModuleError(module_name)
-        try:
-            device_type = device_module.Device.device_type()
-        except AttributeError:
-            raise FastMDAImplementationError(device_module, "Does not subclass AbstractDevice.")
-        except TypeError as e:
-            raise FastMDAImplementationError(device_module, str(e))
-        device_types_info[device_module_info.name] = device_type
-        device_types_modules[device_module_info.name] = device_module
+    loop = asyncio.get_running_loop()
     with SessionLocal() as db:
-        device_infos = crud.get_device_infos(db, limit=999)
-        for device_info_orm in device_infos:
-            device_info = DeviceInfo.from_orm(device_info_orm)
-            device_module = device_types_modules[device_info.device_type]
+        pickled_device_ids = set(crud.get_pickled_device_ids(db))
+        # Resolve the device types first so that the arguments are only loaded for devices that can be instantiated.
+        device_classes = {}
+        for device_id, device_type in crud.iter_all_device_types(db):
+            if device_id in pickled_device_ids:
+                logger.warning("Skipping device with ID %d whose arguments are stored in the old pickled format, run "
+                               "`python -m fastmda.upgrade_db` to convert them.", device_id)
+                continue
+            try:
+                device_classes[device_id] = device_types.load_device_type(sys.intern(device_type))
+            except (FastMDAModuleError, FastMDAImplementationError) as e:
+                logger.warning("Skipping device with ID %d of device type %s: %s", device_id, device_type, e)
+        devices_args = crud.get_devices_args(db, list(device_classes))
+        # The device constructors can block on I/O (serial, TCP, USB, ...) so they are run concurrently in threads.
+        device_instances = await asyncio.gather(*[
+            loop.run_in_executor(None, _instantiate_device, device_class, device_id, devices_args[device_id])
+            for device_id, device_class in device_classes.items()
+        ], return_exceptions=True)
+        connection_statuses = {}
+        for device_id, device in zip(device_classes, device_instances):
+            if isinstance(device, Exception):
+                logger.warning("Skipping device with ID %d which failed to initialize: %s", device_id, device)
+                continue
             try:
-                device_dict[device_info.id] = device_module.Device(device_info.id, **device_info.args)
-                device_info_orm.is_connected = device_dict[device_info.id].is_connected()
-                db.commit()
-            except AttributeError:
-                raise FastMDAImplementationError(device_module, "No Device class implementation.")
-            except TypeError as e:
-                raise FastMDAImplementationError(device_module, str(e))
+                connection_statuses[device_id] = device.is_connected()
+            except Exception as e:
+                logger.warning("Skipping device with ID %d which failed to report its connection status: %s",
+                               device_id, e)
+                continue
+            device_dict[device_id] = device
+        crud.update_devices_connection_status(db, connection_statuses)
 
 
 @app.on_event("shutdown")
 async def disconnect_devices():
-    print("Server shutting down, disconnecting all devices.")
-    # Disconnect all devices
+    logger.info("Server shutting down, disconnecting %d devices.", len(device_dict))
+    # Disconnect all devices concurrently since disconnecting can block on I/O
+    loop = asyncio.get_running_loop()
+    device_ids = list(device_dict)
+    results = await asyncio.gather(*[
+        loop.run_in_executor(None, _disconnect_device, device_dict[device_id]) for device_id in device_ids
+    ], return_exceptions=True)
+    for device_id, result in zip(device_ids, results):
+        if isinstance(result, Exception):
+            logger.warning("Device with ID %d failed to disconnect: %s", device_id, result)
     with SessionLocal() as db:
-        for device_id in device_dict:
-            device_dict[device_id].disconnect()
-            crud.update_device_connection_status(db, device_id, False)
-        # db.query(models.DeviceInfo).update({"is_connected": False})
+        crud.update_devices_connection_status(
+            db, {device_id: False for device_id, result in zip(device_ids, results) if result is True}
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, PickleType
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, JSON
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -9,6 +9,6 @@ class DeviceInfo(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    device_type = Column(String, index=True)
-    args = Column(PickleType, index=True)
-    is_connected = Column(Boolean, index=True)
+    device_type = Column(String)
+    args = Column(JSON)
+    is_connected = Column(Boolean)
@@ -1,7 +1,11 @@
 from __future__ import annotations
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Union
+from math import inf
+from typing import Any, Awaitable, List, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from xarray import DataArray, Dataset
 
 from fastmda import schemas
@@ -27,15 +31,175 @@ def within_limit(value: float, limits: Tuple[Union[float, None], Union[float, No
     )
 
 
+def _setting_info_static(setting: Union[DiscreteSetting, ContinuousSetting]) -> Dict[str, Any]:
+    """
+    Help function for resolving the part of the info of a setting that does not change over its lifetime, i.e. the
+    name and the IDs of the setting and its parent(s).
+
+    :param setting: The setting to resolve the static info of.
+    :type setting: Union[DiscreteSetting, ContinuousSetting]
+    :return: A dictionary of the static info fields of the setting.
+    :rtype: Dict[str, Any]
+    """
+    parent_id, grandparent_id, _ = setting.parent._setting_parent_ids()
+    return {
+        'name': setting.name,
+        'setting_id': setting.setting_id,
+        'parent_id': parent_id,
+        'grandparent_id': grandparent_id,
+    }
+
+
+class Limits(NamedTuple):
+    """
+    The (lower, upper) limits of a continuous value as floats, where no limit is represented by an infinite bound.
+    """
+    lower: float = -inf
+    upper: float = inf
+
+    @classmethod
+    def from_optional(cls, limits: Tuple[Union[float, None], Union[float, None]]) -> Limits:
+        """
+        Method for creating the limits from a tuple where None corresponds to no limit.
+
+        :param limits: A tuple of the (lower, upper) limit, None means no limit.
+        :type limits: Tuple[Union[float, None], Union[float, None]]
+        :return: The limits with infinite bounds instead of None.
+        :rtype: Limits
+        """
+        lower, upper = limits
+        return cls(-inf if lower is None else float(lower), inf if upper is None else float(upper))
+
+    def to_optional(self) -> Tuple[Union[float, None], Union[float, None]]:
+        """
+        Method for getting the limits as a tuple where None corresponds to no limit.
+
+        :return: A tuple of the (lower, upper) limit, None means no limit.
+        :rtype: Tuple[Union[float, None], Union[float, None]]
+        """
+        return None if self.lower == -inf else self.lower, None if self.upper == inf else self.upper
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """
+    Help function for retrieving the exception of a finished future, so that it is not logged as never retrieved if
+    no one awaited the future.
+
+    :param future: The finished future.
+    :type future: asyncio.Future
+    """
+    if not future.cancelled():
+        future.exception()
+
+
+class _ValueRead:
+    """
+    A get_value call shared by the concurrent read_value calls of a value.
+    """
+
+    __slots__ = ('time', 'future', 'waiters')
+
+    def __init__(self, time: float, future: asyncio.Future):
+        """
+        Init method for the _ValueRead class.
+
+        :param time: The loop time when the get_value call was started.
+        :type time: float
+        :param future: The future of the get_value call.
+        :type future: asyncio.Future
+        """
+        self.time = time
+        self.future = future
+        # The number of read_value calls currently awaiting the future.
+        self.waiters = 0
+        future.add_done_callback(_retrieve_exception)
+
+    def is_reusable(self, now: float, ttl: float) -> bool:
+        """
+        Method for checking whether a read_value call can use the get_value call, i.e. if it is still running or if it
+        succeeded less than ttl seconds ago.
+
+        :param now: The current loop time.
+        :type now: float
+        :param ttl: The number of seconds that a read value is reused for.
+        :type ttl: float
+        :return: Whether the get_value call can be used.
+        :rtype: bool
+        """
+        future = self.future
+        if not future.done():
+            return True
+        return now - self.time < ttl and not future.cancelled() and future.exception() is None
+
+
 class __Value(ABC):
     """
     Hidden base class for value.
     """
 
+    __slots__ = ('_info_json', '_value_read')
+
+    # Number of seconds that the value read by read_value is reused for, can be overridden in subclasses.
+    value_cache_ttl = 0.
+
     def __init__(self):
         """
         Init method for __Value class.
         """
+        # Tuple of the (info key, serialized info) of the last info_json call.
+        self._info_json = None
+        # The last get_value call made by read_value.
+        self._value_read = None
+
+    @abstractmethod
+    def _info_key(self) -> tuple:
+        """
+        Help method for getting the values of the info that can change, the serialized info is reused as long as the
+        key is equal.
+
+        :return: A tuple of the values of the info that can change.
+        :rtype: tuple
+        """
+
+    def info_json(self) -> bytes:
+        """
+        Method for getting the info serialized as JSON. The serialized info is cached and only rebuilt when any of the
+        values that can change is changed.
+
+        :return: The info serialized as JSON.
+        :rtype: bytes
+        """
+        key = self._info_key()
+        cached = self._info_json
+        if cached is None or cached[0] != key:
+            cached = self._info_json = (key, self.info.json(separators=(",", ":")).encode())
+        return cached[1]
+
+    async def read_value(self) -> Any:
+        """
+        Asynchronous method for reading the current value with get_value, where concurrent reads share one get_value
+        call. A successfully read value is also reused by the reads started within value_cache_ttl seconds, until the
+        value is set. Cancelling a read, e.g. by a timeout, only cancels the shared get_value call if no other read is
+        waiting for it, so that a hanging get_value is not handed to the later reads.
+
+        :return: The current value.
+        :rtype: Any
+        """
+        loop = asyncio.get_running_loop()
+        read = self._value_read
+        if read is None or not read.is_reusable(loop.time(), self.value_cache_ttl):
+            read = self._value_read = _ValueRead(loop.time(), asyncio.ensure_future(self.get_value()))
+        elif read.future.done():
+            return read.future.result()
+        read.waiters += 1
+        try:
+            return await asyncio.shield(read.future)
+        finally:
+            read.waiters -= 1
+            if not read.waiters and not read.future.done():
+                read.future.cancel()
+                if self._value_read is read:
+                    self._value_read = None
 
     @property
     @abstractmethod
@@ -72,12 +236,16 @@ class __DiscreteValue(__Value, ABC):
     Hidden base class for discrete value.
     """
 
+    __slots__ = ('_invalid_value_index', '_invalid_values')
+
     def __init__(self):
         """
         Init method for __DiscreteValue class.
         """
         super().__init__()
-        self._invalid_value_index = []
+        self._invalid_value_index = set()
+        # Sorted tuple of the invalid value indices, rebuilt on the first get_invalid_values after a change.
+        self._invalid_values = ()
 
     @abstractmethod
     async def get_value(self) -> str:
@@ -91,24 +259,40 @@ class __DiscreteValue(__Value, ABC):
     @abstractmethod
     def get_value_options(self) -> List[str]:
         """
-        Method for getting a list of all optional values.
+        Method for getting a list of all optional values. It is called on every info_json call (i.e. every info request)
+        to detect changed options, so subclasses should return a stored list rather than build the options per call.
 
         :return:
         :rtype:
         """
 
+    def num_value_options(self) -> int:
+        """
+        Method for getting the number of optional values. Subclasses that build the list of optional values in
+        get_value_options can override this method to avoid building the list only to get its length.
+
+        :return: The number of optional values.
+        :rtype: int
+        """
+        return len(self.get_value_options())
+
     @abstractmethod
-    async def _set_value(self, value_index: int):
+    async def _set_value(self, value_index: int) -> Optional[str]:
         """
         Asynchronous private method for setting the current value by the zero indexed position in the value options
         list.
+        The device is busy while it runs, other values of the same device can only be set by awaiting their set_value
+        directly in the same task.
 
         :param value_index: The index of the value to set.
         :type value_index: int
-        :return: None
-        :rtype: None
+        :return: The value after it was set if it is known, otherwise None.
+        :rtype: Optional[str]
         """
 
+    def _info_key(self) -> tuple:
+        return tuple(self.get_value_options()), self.get_invalid_values()
+
     def set_invalid_value(self, invalid_value_index: int):
         """
         Method for setting temporarily invalid values.
@@ -118,17 +302,19 @@ class __DiscreteValue(__Value, ABC):
         :return: None
         :rtype: None
         """
-        if invalid_value_index not in self._invalid_value_index:
-            self._invalid_value_index.append(invalid_value_index)
+        self._invalid_value_index.add(invalid_value_index)
+        self._invalid_values = None
 
-    def get_invalid_values(self) -> List[int]:
+    def get_invalid_values(self) -> Tuple[int, ...]:
         """
         Method for getting temporarily invalid value index.
 
-        :return: A list of the index of the temporarily invalid values.
-        :rtype: List[int]
+        :return: A sorted tuple of the index of the temporarily invalid values.
+        :rtype: Tuple[int, ...]
         """
-        return self._invalid_value_index
+        if self._invalid_values is None:
+            self._invalid_values = tuple(sorted(self._invalid_value_index))
+        return self._invalid_values
 
     def set_valid_value(self, valid_value_index: int):
         """
@@ -139,8 +325,8 @@ class __DiscreteValue(__Value, ABC):
         :return: None
         :rtype: None
         """
-        if valid_value_index not in self._invalid_value_index:
-            self._invalid_value_index.remove(valid_value_index)
+        self._invalid_value_index.discard(valid_value_index)
+        self._invalid_values = None
 
 
 class __ContinuousValue(__Value, ABC):
@@ -148,12 +334,17 @@ class __ContinuousValue(__Value, ABC):
     Hidden base class for a continuous value.
     """
 
+    __slots__ = ('_soft_limits', '_soft_limits_active', '_cached_hard_limits')
+
     def __init__(self):
         """
         Init method for __ContinuousValue class.
         """
         super().__init__()
-        self._soft_limits = (None, None)
+        self._soft_limits = Limits()
+        self._soft_limits_active = False
+        # The hard limits are read from get_hard_limits on the first use, see refresh_hard_limits.
+        self._cached_hard_limits = None
 
     @abstractmethod
     def get_hard_limits(self) -> Tuple[float, float]:
@@ -174,24 +365,68 @@ class __ContinuousValue(__Value, ABC):
         """
 
     @abstractmethod
-    async def _set_value(self, value: float):
+    async def _set_value(self, value: float) -> Optional[float]:
         """
         Asynchronous private method for setting the value of the actuator, should be overridden in subclass.
+        The device is busy while it runs, other values of the same device can only be set by awaiting their set_value
+        directly in the same task.
 
         :param value: Value to set the actuator to.
         :type value: float
-        :return: None
-        :rtype: None
+        :return: The value after it was set if it is known, otherwise None.
+        :rtype: Optional[float]
         """
 
+    def _info_key(self) -> tuple:
+        return self.get_cached_hard_limits(), self._soft_limits
+
+    def get_cached_hard_limits(self) -> Limits:
+        """
+        Method for getting the hard limits as read by the last refresh_hard_limits call, which is done on first use.
+
+        :return: The cached hard limits.
+        :rtype: Limits
+        """
+        hard_limits = self._cached_hard_limits
+        if hard_limits is None:
+            hard_limits = self.refresh_hard_limits()
+        return hard_limits
+
+    def refresh_hard_limits(self) -> Limits:
+        """
+        Method for reading the hard limits from get_hard_limits again. The hard limits are only read on first use
+        (by set_value or info), so this method should be called by subclasses whose hard limits can change.
+
+        :return: The new hard limits.
+        :rtype: Limits
+        """
+        self._cached_hard_limits = Limits.from_optional(self.get_hard_limits())
+        return self._cached_hard_limits
+
+    def values_within_limits(self, values: Sequence[float]) -> bool:
+        """
+        Method for checking that all the values are within both the hard and the soft limits, e.g. for validating all
+        the points of a scan once before setting them with set_value_unchecked.
+
+        :param values: The values to check.
+        :type values: Sequence[float]
+        :return: Whether or not all the values are within the limits.
+        :rtype: bool
+        """
+        hard_limits = self.get_cached_hard_limits()
+        lower = max(hard_limits.lower, self._soft_limits.lower)
+        upper = min(hard_limits.upper, self._soft_limits.upper)
+        values = np.asarray(values, dtype=float)
+        return bool(np.all((lower <= values) & (values <= upper)))
+
     def get_soft_limits(self) -> Tuple[float, float]:
         """
         Method for getting the software limits of the actuator.
 
-        :return: A tuple of the (lower, upper) limit of the actuator.
-        :rtype: Tuple[float, float]
+        :return: A tuple of the (lower, upper) limit of the actuator, None means no limit.
+        :rtype: Tuple[Union[float, None], Union[float, None]]
         """
-        return self._soft_limits
+        return self._soft_limits.to_optional()
 
     def set_soft_limits(self, limits: Tuple[float, float]):
         """
@@ -202,7 +437,8 @@ class __ContinuousValue(__Value, ABC):
         :return: None
         :rtype: None
         """
-        self._soft_limits = limits
+        self._soft_limits = Limits.from_optional(limits)
+        self._soft_limits_active = limits[0] is not None or limits[1] is not None
 
 
 class DiscreteSetting(__DiscreteValue, ABC):
@@ -210,6 +446,8 @@ class DiscreteSetting(__DiscreteValue, ABC):
     Abstract class for a discrete setting.
     """
 
+    __slots__ = ('setting_id', 'parent', '_info_static', '_device')
+
     def __init__(self, setting_id: int, parent: Union[AbstractDevice, DiscreteActuator, ContinuousActuator, Detector]):
         """
         Constructor of the DiscreteSetting class.
@@ -222,31 +460,34 @@ class DiscreteSetting(__DiscreteValue, ABC):
         super().__init__()
         self.setting_id = setting_id
         self.parent = parent
+        # The static info and the device are resolved on first use, when the parent is fully constructed.
+        self._info_static = None
+        self._device = None
 
-    async def set_value(self, value_index: int):
+    def set_value(self, value_index: int) -> Awaitable[Any]:
         """
-        Asynchronous method for setting the value of the setting.
+        Method for setting the value of the setting. The value is validated directly and the returned awaitable
+        sets the value.
 
         :param value_index: Index of the value to set.
         :type value_index: int
-        :return: None
-        :rtype: None
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
         :raises FastMDAatSoftSettingLimit: If value is temporarily set as invalid.
         :raises FastMDAatHardSettingLimit: If index is out of bounds.
-        :raises FastMDAisBusy: If the device is busy.
+        :raises FastMDAisBusy: If the device is busy, also raised by the awaitable if another value of the device is
+            being set.
         """
+        device = self._device
+        if device is None:
+            device = self._device = self.parent._setting_device()
         if not self.is_able_to_set():
-            if isinstance(self.parent, AbstractDevice):
-                device_id = self.parent.device_id
-            else:
-                device_id = self.parent.parent.device_id
-            raise FastMDAisBusy(device_id)
-        if value_index >= len(self.get_value_options()):
-            raise FastMDAatHardSettingLimit(setting_info=self.info)
+            raise FastMDAisBusy(device.device_id)
+        if value_index >= self.num_value_options():
+            raise FastMDAatHardSettingLimit(setting_info_factory=lambda: self.info)
         if value_index in self._invalid_value_index:
-            raise FastMDAatSoftSettingLimit(setting_info=self.info)
-        else:
-            await self._set_value(value_index)
+            raise FastMDAatSoftSettingLimit(setting_info_factory=lambda: self.info)
+        return device._set_exclusively(self, value_index)
 
     @property
     def info(self) -> schemas.DiscreteSettingInfo:
@@ -255,24 +496,11 @@ class DiscreteSetting(__DiscreteValue, ABC):
 
         :return: The info for the instance of the discrete setting.
         :rtype: schemas.DiscreteSettingInfo
-        :raises ValueError: If parent property is not of known type.
-        """
-        if isinstance(self.parent, AbstractDevice):
-            parent_id = self.parent.device_id
-            grandparent_id = None
-        elif isinstance(self.parent, DiscreteActuator) or isinstance(self.parent, ContinuousActuator):
-            parent_id = self.parent.actuator_id
-            grandparent_id = self.parent.parent.device_id
-        elif isinstance(self.parent, Detector):
-            parent_id = self.parent.detector_id
-            grandparent_id = self.parent.parent.device_id
-        else:
-            raise ValueError("parent is not of known type.")
-        return schemas.DiscreteSettingInfo(
-            name=self.name,
-            setting_id=self.setting_id,
-            parent_id=parent_id,
-            grandparent_id=grandparent_id,
+        """
+        if self._info_static is None:
+            self._info_static = _setting_info_static(self)
+        return schemas.DiscreteSettingInfo.construct(
+            **self._info_static,
             # value=self.get_value(),
             options=self.get_value_options(),
             invalid_values=self.get_invalid_values()
@@ -284,6 +512,8 @@ class ContinuousSetting(__ContinuousValue, ABC):
     Abstract class for a continuous setting.
     """
 
+    __slots__ = ('setting_id', 'parent', '_info_static', '_device')
+
     def __init__(self, setting_id: int, parent: Union[AbstractDevice, DiscreteActuator, ContinuousActuator, Detector]):
         """
         Constructor of the ContinuousSetting class.
@@ -296,32 +526,52 @@ class ContinuousSetting(__ContinuousValue, ABC):
         super().__init__()
         self.setting_id = setting_id
         self.parent = parent
+        self._info_static = None
+        self._device = None
 
-    async def set_value(self, value: float):
+    def set_value(self, value: float) -> Awaitable[Any]:
         """
-        Asynchronous method for setting the value of the setting.
+        Method for setting the value of the setting. The value is validated directly and the returned awaitable
+        sets the value.
 
         :param value: Value to set the setting to.
         :type value: float
-        :return: None
-        :rtype: None
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
         :raises FastMDAatSoftwareLimit: If value is outside soft limits.
         :raises FastMDAatHardwareLimit: If value is outside hard limits.
-        :raises FastMDAisBusy: If the device is busy.
+        :raises FastMDAisBusy: If the device is busy, also raised by the awaitable if another value of the device is
+            being set.
         """
+        device = self._device
+        if device is None:
+            device = self._device = self.parent._setting_device()
         if not self.is_able_to_set():
-            if isinstance(self.parent, AbstractDevice):
-                device_id = self.parent.device_id
-            else:
-                device_id = self.parent.parent.device_id
-            raise FastMDAisBusy(device_id)
-        hard_limits = self.get_hard_limits()
-        if not within_limit(value, hard_limits):
-            raise FastMDAatHardSettingLimit(setting_info=self.info)
-        if within_limit(value, self._soft_limits):
-            await self._set_value(value)
-        else:
-            raise FastMDAatSoftSettingLimit(setting_info=self.info)
+            raise FastMDAisBusy(device.device_id)
+        hard_limits = self._cached_hard_limits
+        if hard_limits is None:
+            hard_limits = self.refresh_hard_limits()
+        if not hard_limits.lower <= value <= hard_limits.upper:
+            raise FastMDAatHardSettingLimit(setting_info_factory=lambda: self.info)
+        if self._soft_limits_active and not self._soft_limits.lower <= value <= self._soft_limits.upper:
+            raise FastMDAatSoftSettingLimit(setting_info_factory=lambda: self.info)
+        return device._set_exclusively(self, value)
+
+    def set_value_unchecked(self, value: float) -> Awaitable[Any]:
+        """
+        Method for setting the value of the setting without checking if the setting can be set or if the value is
+        within the limits. Should only be used for values that have been checked with values_within_limits.
+
+        :param value: Value to set the setting to.
+        :type value: float
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
+        :raises FastMDAisBusy: Raised by the awaitable if another value of the device is being set.
+        """
+        device = self._device
+        if device is None:
+            device = self._device = self.parent._setting_device()
+        return device._set_exclusively(self, value)
 
     @property
     def info(self) -> schemas.ContinuousSettingInfo:
@@ -330,27 +580,14 @@ class ContinuousSetting(__ContinuousValue, ABC):
 
         :return: The info for the instance of the continuous setting.
         :rtype: schemas.ContinuousSettingInfo
-        :raises ValueError: If parent property is not of known type.
-        """
-        if isinstance(self.parent, AbstractDevice):
-            parent_id = self.parent.device_id
-            grandparent_id = None
-        elif isinstance(self.parent, DiscreteActuator) or isinstance(self.parent, ContinuousActuator):
-            parent_id = self.parent.actuator_id
-            grandparent_id = self.parent.parent.device_id
-        elif isinstance(self.parent, Detector):
-            parent_id = self.parent.detector_id
-            grandparent_id = self.parent.parent.device_id
-        else:
-            raise ValueError("parent is not of known type.")
-        return schemas.ContinuousSettingInfo(
-            name=self.name,
-            setting_id=self.setting_id,
-            parent_id=parent_id,
-            grandparent_id=grandparent_id,
+        """
+        if self._info_static is None:
+            self._info_static = _setting_info_static(self)
+        return schemas.ContinuousSettingInfo.construct(
+            **self._info_static,
             # value=self.get_value(),
-            hard_limits=self.get_hard_limits(),
-            soft_limits=self._soft_limits
+            hard_limits=self.get_cached_hard_limits().to_optional(),
+            soft_limits=self.get_soft_limits()
         )
 
 
@@ -359,6 +596,8 @@ class DiscreteActuator(__DiscreteValue, ABC):
     Abstract class for a discrete actuator.
     """
 
+    __slots__ = ('actuator_id', 'parent', '_info_static')
+
     def __init__(self, actuator_id: int, parent: AbstractDevice):
         """
         Constructor of the DiscreteActuator class.
@@ -371,6 +610,25 @@ class DiscreteActuator(__DiscreteValue, ABC):
         super().__init__()
         self.actuator_id = actuator_id
         self.parent = parent
+        self._info_static = None
+
+    def _setting_parent_ids(self) -> Tuple[int, Optional[int], int]:
+        """
+        Method for getting the IDs needed by the settings of this instance.
+
+        :return: A tuple of the (parent_id, grandparent_id, device_id) for a setting with this instance as parent.
+        :rtype: Tuple[int, Optional[int], int]
+        """
+        return self.actuator_id, self.parent.device_id, self.parent.device_id
+
+    def _setting_device(self) -> AbstractDevice:
+        """
+        Method for getting the device of the settings of this instance.
+
+        :return: The device which a setting with this instance as parent belongs to.
+        :rtype: AbstractDevice
+        """
+        return self.parent
 
     @property
     @abstractmethod
@@ -382,26 +640,26 @@ class DiscreteActuator(__DiscreteValue, ABC):
         :rtype: Dict[int, Union[DiscreteSetting, ContinuousSetting]]
         """
 
-    async def set_value(self, value_index: int):
+    def set_value(self, value_index: int) -> Awaitable[Any]:
         """
-        Asynchronous method for setting the value.
+        Method for setting the value. The value is validated directly and the returned awaitable sets the value.
 
         :param value_index: Index of the value to set.
         :type value_index: int
-        :return: None
-        :rtype: None
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
         :raises FastMDAatSoftwareLimit: If value is temporarily set as invalid.
         :raises FastMDAatHardwareLimit: If index is out of bounds.
-        :raises FastMDAisBusy: If the device is busy.
+        :raises FastMDAisBusy: If the device is busy, also raised by the awaitable if another value of the device is
+            being set.
         """
         if not self.is_able_to_set():
             raise FastMDAisBusy(self.parent.device_id)
-        if value_index >= len(self.get_value_options()):
-            raise FastMDAatHardwareLimit(actuator_info=self.info)
+        if value_index >= self.num_value_options():
+            raise FastMDAatHardwareLimit(actuator_info_factory=lambda: self.info)
         if value_index in self._invalid_value_index:
-            raise FastMDAatSoftwareLimit(actuator_info=self.info)
-        else:
-            await self._set_value(value_index)
+            raise FastMDAatSoftwareLimit(actuator_info_factory=lambda: self.info)
+        return self.parent._set_exclusively(self, value_index)
 
     @property
     def info(self) -> schemas.DiscreteActuatorInfo:
@@ -411,10 +669,14 @@ class DiscreteActuator(__DiscreteValue, ABC):
         :return: The info for the instance of the discrete actuator.
         :rtype: schemas.DiscreteActuatorInfo
         """
-        return schemas.DiscreteActuatorInfo(
-            name=self.name,
-            actuator_id=self.actuator_id,
-            device_id=self.parent.device_id,
+        if self._info_static is None:
+            self._info_static = {
+                'name': self.name,
+                'actuator_id': self.actuator_id,
+                'device_id': self.parent.device_id,
+            }
+        return schemas.DiscreteActuatorInfo.construct(
+            **self._info_static,
             # value=self.get_value(),
             options=self.get_value_options(),
             invalid_values=self.get_invalid_values()
@@ -426,6 +688,8 @@ class ContinuousActuator(__ContinuousValue, ABC):
     Abstract class for a continuous actuator.
     """
 
+    __slots__ = ('actuator_id', 'parent', '_info_static')
+
     def __init__(self, actuator_id: int, parent: AbstractDevice):
         """
         Constructor of the ContinuousActuator class.
@@ -438,6 +702,25 @@ class ContinuousActuator(__ContinuousValue, ABC):
         super().__init__()
         self.actuator_id = actuator_id
         self.parent = parent
+        self._info_static = None
+
+    def _setting_parent_ids(self) -> Tuple[int, Optional[int], int]:
+        """
+        Method for getting the IDs needed by the settings of this instance.
+
+        :return: A tuple of the (parent_id, grandparent_id, device_id) for a setting with this instance as parent.
+        :rtype: Tuple[int, Optional[int], int]
+        """
+        return self.actuator_id, self.parent.device_id, self.parent.device_id
+
+    def _setting_device(self) -> AbstractDevice:
+        """
+        Method for getting the device of the settings of this instance.
+
+        :return: The device which a setting with this instance as parent belongs to.
+        :rtype: AbstractDevice
+        """
+        return self.parent
 
     @property
     @abstractmethod
@@ -449,27 +732,43 @@ class ContinuousActuator(__ContinuousValue, ABC):
         :rtype: Dict[int, Union[DiscreteSetting, ContinuousSetting]]
         """
 
-    async def set_value(self, value: float):
+    def set_value(self, value: float) -> Awaitable[Any]:
         """
-        Asynchronous method for setting the value of the actuator.
+        Method for setting the value of the actuator. The value is validated directly and the returned awaitable
+        sets the value.
 
         :param value: Value to set the actuator to.
         :type value: float
-        :return: None
-        :rtype: None
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
         :raises FastMDAatSoftwareLimit: If value is outside software limits.
         :raises FastMDAatHardwareLimit: If value is outside hardware limits.
-        :raises FastMDAisBusy: If the device is busy.
+        :raises FastMDAisBusy: If the device is busy, also raised by the awaitable if another value of the device is
+            being set.
         """
         if not self.is_able_to_set():
             raise FastMDAisBusy(self.parent.device_id)
-        hard_limits = self.get_hard_limits()
-        if not within_limit(value, hard_limits):
-            raise FastMDAatHardwareLimit(actuator_info=self.info)
-        if within_limit(value, self._soft_limits):
-            await self._set_value(value)
-        else:
-            raise FastMDAatSoftwareLimit(actuator_info=self.info)
+        hard_limits = self._cached_hard_limits
+        if hard_limits is None:
+            hard_limits = self.refresh_hard_limits()
+        if not hard_limits.lower <= value <= hard_limits.upper:
+            raise FastMDAatHardwareLimit(actuator_info_factory=lambda: self.info)
+        if self._soft_limits_active and not self._soft_limits.lower <= value <= self._soft_limits.upper:
+            raise FastMDAatSoftwareLimit(actuator_info_factory=lambda: self.info)
+        return self.parent._set_exclusively(self, value)
+
+    def set_value_unchecked(self, value: float) -> Awaitable[Any]:
+        """
+        Method for setting the value of the actuator without checking if the actuator can be set or if the value is
+        within the limits. Should only be used for values that have been checked with values_within_limits.
+
+        :param value: Value to set the actuator to.
+        :type value: float
+        :return: An awaitable which sets the value and returns the new value if it is known, otherwise None.
+        :rtype: Awaitable[Any]
+        :raises FastMDAisBusy: Raised by the awaitable if another value of the device is being set.
+        """
+        return self.parent._set_exclusively(self, value)
 
     @property
     def info(self) -> schemas.ContinuousActuatorInfo:
@@ -479,21 +778,39 @@ class ContinuousActuator(__ContinuousValue, ABC):
         :return: The info for the instance of the discrete actuator.
         :rtype: schemas.DiscreteActuatorInfo
         """
-        return schemas.ContinuousActuatorInfo(
-            name=self.name,
-            actuator_id=self.actuator_id,
-            device_id=self.parent.device_id,
+        if self._info_static is None:
+            self._info_static = {
+                'name': self.name,
+                'actuator_id': self.actuator_id,
+                'device_id': self.parent.device_id,
+            }
+        return schemas.ContinuousActuatorInfo.construct(
+            **self._info_static,
             # value=self.get_value(),
-            hardware_limits=self.get_hard_limits(),
-            software_limits=self._soft_limits
+            hardware_limits=self.get_cached_hard_limits().to_optional(),
+            software_limits=self.get_soft_limits()
         )
 
 
+class RawData(NamedTuple):
+    """
+    The data of a single acquisition of a detector before it is wrapped in a DataArray, i.e. the arguments of the
+    DataArray constructor.
+    """
+    data: np.ndarray
+    dims: Tuple[str, ...]
+    coords: Mapping[str, Any]
+    attrs: Mapping[str, Any]
+    name: str
+
+
 class Detector(ABC):
     """
     Abstract class for the detector part of the device.
     """
 
+    __slots__ = ('detector_id', 'parent', 'dimensionality', '_info', '_info_json')
+
     def __init__(self, detector_id: int, parent: AbstractDevice, dimensionality: int = 1):
         """
         Constructor for the super class
@@ -508,6 +825,27 @@ class Detector(ABC):
         self.detector_id = detector_id
         self.parent = parent
         self.dimensionality = dimensionality
+        # The info of a detector does not change, it is built on first use when the subclass is fully constructed.
+        self._info = None
+        self._info_json = None
+
+    def _setting_parent_ids(self) -> Tuple[int, Optional[int], int]:
+        """
+        Method for getting the IDs needed by the settings of this instance.
+
+        :return: A tuple of the (parent_id, grandparent_id, device_id) for a setting with this instance as parent.
+        :rtype: Tuple[int, Optional[int], int]
+        """
+        return self.detector_id, self.parent.device_id, self.parent.device_id
+
+    def _setting_device(self) -> AbstractDevice:
+        """
+        Method for getting the device of the settings of this instance.
+
+        :return: The device which a setting with this instance as parent belongs to.
+        :rtype: AbstractDevice
+        """
+        return self.parent
 
     @property
     @abstractmethod
@@ -561,27 +899,99 @@ class Detector(ABC):
         else:
             raise FastMDAisBusy(self.parent.device_id)
 
+    def _acquire_raw(self) -> RawData:
+        """
+        Method for acquiring data from the detector without wrapping it in a DataArray. Defaults to unpacking the
+        DataArray from _acquire, should be overridden in subclasses that can return the data directly to avoid the
+        DataArray construction when acquiring in batches.
+
+        :return: The measured data and the arguments needed to wrap it in a DataArray.
+        :rtype: RawData
+        """
+        data_array = self._acquire()
+        return RawData(
+            data=data_array.values,
+            dims=data_array.dims,
+            coords={name: (coord.dims, coord.values) for name, coord in data_array.coords.items()},
+            attrs=data_array.attrs,
+            name=data_array.name
+        )
+
+    def _acquire_batch(self, n: int) -> DataArray:
+        """
+        Method for acquiring several data sets from the detector in a row. Defaults to writing the data of n calls of
+        _acquire_raw into one preallocated array, should be overridden in subclasses of detectors that can acquire
+        several data sets with a single command.
+
+        :param n: The number of data sets to acquire, at least 1.
+        :type n: int
+        :return: The measured data in a DataArray with the acquisitions along the first dimension "acquisition".
+        :rtype: xarray.DataArray
+        """
+        first = self._acquire_raw()
+        data = np.empty((n, *np.shape(first.data)), dtype=np.asarray(first.data).dtype)
+        data[0] = first.data
+        for i in range(1, n):
+            data[i] = self._acquire_raw().data
+        return DataArray(data, dims=('acquisition', *first.dims), coords=first.coords, attrs=first.attrs,
+                         name=first.name)
+
+    def acquire_batch(self, n: int) -> DataArray:
+        """
+        Method for acquiring several data sets from the detector in a row. The detector is only checked for being able
+        to acquire once, before the first acquisition.
+
+        :param n: The number of data sets to acquire, at least 1.
+        :type n: int
+        :return: The measured data in a DataArray with the acquisitions along the first dimension "acquisition".
+        :rtype: xarray.DataArray
+        :raises ValueError: If n is less than 1.
+        :raises FastMDAisBusy: If the detector is not able to acquire.
+        """
+        if n < 1:
+            raise ValueError(f"The number of data sets to acquire must be at least 1, not {n}.")
+        if self.is_able_to_acquire():
+            return self._acquire_batch(n)
+        else:
+            raise FastMDAisBusy(self.parent.device_id)
+
     @property
-    def info(self):
+    def info(self) -> schemas.DetectorInfo:
         """
         Getter method for the info property.
 
         :return: The info for the instance of the detector.
         :rtype: schemas.DetectorInfo
         """
-        return schemas.DetectorInfo(
-            name=self.name,
-            actuator_id=self.detector_id,
-            device_id=self.parent.device_id,
-            dimensionality=self.dimensionality
-        )
+        if self._info is None:
+            self._info = schemas.DetectorInfo.construct(
+                name=self.name,
+                detector_id=self.detector_id,
+                device_id=self.parent.device_id,
+                dimensionality=self.dimensionality
+            )
+        return self._info
+
+    def info_json(self) -> bytes:
+        """
+        Method for getting the info serialized as JSON, the serialized info is cached on first use.
+
+        :return: The info serialized as JSON.
+        :rtype: bytes
+        """
+        if self._info_json is None:
+            self._info_json = self.info.json(separators=(",", ":")).encode()
+        return self._info_json
 
 
 class AbstractDevice(ABC):
     """
     Abstract class to be inherited by any device the controls the communication with actuators and/or detectors.
+    Subclasses should declare `__slots__` for their own attributes, otherwise the instances get a `__dict__` anyway.
     """
 
+    __slots__ = ('device_id', 'busy_lock', '_busy_task', '_actuator_partitions')
+
     @staticmethod
     @abstractmethod
     def device_type() -> schemas.DeviceType:
@@ -595,6 +1005,63 @@ class AbstractDevice(ABC):
         :type device_id: int
         """
         self.device_id = device_id
+        # Held while a value of the device is set or while the device is connected or disconnected, which can happen
+        # concurrently since the connect and disconnect routes run in the thread pool.
+        self.busy_lock = threading.Lock()
+        # The task setting a value of the device while it holds the busy lock.
+        self._busy_task = None
+        self._actuator_partitions = None
+
+    async def _set_exclusively(self, value_object: Union[DiscreteActuator, ContinuousActuator, DiscreteSetting,
+                                                         ContinuousSetting], value: Any) -> Any:
+        """
+        Asynchronous method for setting a value of the device while marking the device as busy, so that only one
+        value of the device is set at the time. The busy lock is acquired without blocking, so the check is atomic also
+        with respect to connect and disconnect calls running in other threads. A _set_value may set other values of
+        the same device by awaiting their set_value directly, since the task that holds the busy lock is not blocked by
+        it. The value read by read_value is discarded when the set is done.
+
+        :param value_object: The actuator or setting whose private _set_value method to call.
+        :type value_object: Union[DiscreteActuator, ContinuousActuator, DiscreteSetting, ContinuousSetting]
+        :param value: The value (or value index) to pass to _set_value.
+        :type value: Any
+        :return: The return value of _set_value, i.e. the new value if it is known, otherwise None.
+        :rtype: Any
+        :raises FastMDAisBusy: If a value of the device is already being set, or the device is being (dis)connected.
+        """
+        task = asyncio.current_task()
+        if self._busy_task is not None and self._busy_task is task:
+            try:
+                return await value_object._set_value(value)
+            finally:
+                value_object._value_read = None
+        if not self.busy_lock.acquire(blocking=False):
+            raise FastMDAisBusy(self.device_id)
+        self._busy_task = task
+        try:
+            return await value_object._set_value(value)
+        finally:
+            self._busy_task = None
+            self.busy_lock.release()
+            value_object._value_read = None
+
+    def _setting_parent_ids(self) -> Tuple[int, Optional[int], int]:
+        """
+        Method for getting the IDs needed by the settings of this instance.
+
+        :return: A tuple of the (parent_id, grandparent_id, device_id) for a setting with this instance as parent.
+        :rtype: Tuple[int, Optional[int], int]
+        """
+        return self.device_id, None, self.device_id
+
+    def _setting_device(self) -> AbstractDevice:
+        """
+        Method for getting the device of the settings of this instance.
+
+        :return: The device which a setting with this instance as parent belongs to.
+        :rtype: AbstractDevice
+        """
+        return self
 
     @property
     @abstractmethod
@@ -626,6 +1093,63 @@ class AbstractDevice(ABC):
         :rtype: Dict[int, Union[DiscreteSetting, ContinuousSetting]]
         """
 
+    def cache_info(self):
+        """
+        Method for building the cached info of all the actuators, detectors and settings (including the settings of the
+        actuators and detectors) of the device, e.g. right after connecting so that the first requests for the info do
+        not have to read it from the device.
+
+        :return: None
+        :rtype: None
+        """
+        for setting in self.settings.values():
+            setting.info_json()
+        for parent in (*self.actuators.values(), *self.detectors.values()):
+            parent.info_json()
+            for setting in parent.settings.values():
+                setting.info_json()
+
+    def _partition_actuators(self) -> Tuple[Dict[int, DiscreteActuator], Dict[int, ContinuousActuator]]:
+        """
+        Help method for splitting the actuators into discrete and continuous actuators. The split is only redone when
+        the actuators property returns another mapping than the last time.
+
+        :return: A tuple of the (discrete, continuous) actuator dictionaries.
+        :rtype: Tuple[Dict[int, DiscreteActuator], Dict[int, ContinuousActuator]]
+        """
+        actuators = self.actuators
+        partitions = self._actuator_partitions
+        if partitions is None or partitions[0] is not actuators:
+            discrete = {}
+            continuous = {}
+            for actuator_id, actuator in actuators.items():
+                if isinstance(actuator, DiscreteActuator):
+                    discrete[actuator_id] = actuator
+                elif isinstance(actuator, ContinuousActuator):
+                    continuous[actuator_id] = actuator
+            partitions = self._actuator_partitions = (actuators, discrete, continuous)
+        return partitions[1], partitions[2]
+
+    @property
+    def discrete_actuators(self) -> Dict[int, DiscreteActuator]:
+        """
+        Getter method for the discrete_actuators property.
+
+        :return: A dictionary of the discrete actuators of the device.
+        :rtype: Dict[int, DiscreteActuator]
+        """
+        return self._partition_actuators()[0]
+
+    @property
+    def continuous_actuators(self) -> Dict[int, ContinuousActuator]:
+        """
+        Getter method for the continuous_actuators property.
+
+        :return: A dictionary of the continuous actuators of the device.
+        :rtype: Dict[int, ContinuousActuator]
+        """
+        return self._partition_actuators()[1]
+
     @abstractmethod
     def connect(self) -> bool:
         """
@@ -661,6 +1185,8 @@ class AbstractMeasurement(ABC):
     Abstract class to be inherited by any measurement implemented on the server side.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         Constructor for the Measurement class.
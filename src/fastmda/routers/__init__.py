@@ -0,0 +1,72 @@
+import asyncio
+from typing import Iterable, Union
+
+from fastapi import HTTPException, status
+from fastapi.responses import Response
+
+from fastmda.exceptions import FastMDAatHardSettingLimit, FastMDAatSoftSettingLimit, FastMDAisBusy
+from fastmda.objects import DiscreteActuator, ContinuousActuator, DiscreteSetting, ContinuousSetting, Detector
+
+# Timeouts in seconds of the value sets and reads of the routes.
+set_timeout = 5
+get_timeout = 0.1
+
+
+def info_list_response(values: Iterable[Union[DiscreteActuator, ContinuousActuator, DiscreteSetting, ContinuousSetting,
+                                              Detector]]) -> Response:
+    """
+    Help function for responding with a list of the cached serialized info of actuators, settings or detectors. The
+    info is built by the objects themselves and is returned without validating it against the response model again.
+
+    :param values: The actuators, settings or detectors to respond with the info of.
+    :type values: Iterable[Union[DiscreteActuator, ContinuousActuator, DiscreteSetting, ContinuousSetting, Detector]]
+    :return: The response with the JSON list of the info.
+    :rtype: Response
+    """
+    return Response(b"[" + b",".join(value.info_json() for value in values) + b"]", media_type="application/json")
+
+
+async def set_setting_value(setting: Union[DiscreteSetting, ContinuousSetting],
+                            value: Union[int, float]) -> Union[str, float]:
+    """
+    Help function for setting the value of a setting and getting the new value, shared by the setting set routes of
+    the devices, actuators and detectors.
+
+    :param setting: The setting to set the value of.
+    :type setting: Union[DiscreteSetting, ContinuousSetting]
+    :param value: The value to set the setting to, the index of the value for discrete settings.
+    :type value: Union[int, float]
+    :return: The value of the setting after it was set.
+    :rtype: Union[str, float]
+    :raises HTTPException: 406 if the value is outside the limits, 423 if the device is busy and 504 if the value could
+        not be set or read back within the timeouts.
+    """
+    try:
+        new_value = await asyncio.wait_for(setting.set_value(value), timeout=set_timeout)
+        if new_value is not None:
+            return new_value
+        try:
+            return await asyncio.wait_for(setting.get_value(), timeout=get_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                                detail=f"The set could not be read within the timeout of {get_timeout} s.")
+    except FastMDAisBusy:
+        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
+    except FastMDAatHardSettingLimit:
+        if isinstance(setting, DiscreteSetting):
+            raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                                detail=f"The value index {value} is outside the options of the setting " +
+                                       f"{setting.get_value_options()}")
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                            detail=f"The value of {value} is outside the hard limits of the setting " +
+                                   f"{setting.get_cached_hard_limits().to_optional()}")
+    except FastMDAatSoftSettingLimit:
+        if isinstance(setting, DiscreteSetting):
+            raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                                detail=f"The value index {value} is temporarily invalid for the setting.")
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                            detail=f"The value of {value} is outside the soft limits of the setting " +
+                                   f"{setting.get_soft_limits()}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                            detail=f"The value of {value} could not be set within the timeout of {set_timeout} s.")
@@ -1,332 +1,287 @@
 import asyncio
 from typing import List, Union
 
-from fastapi import APIRouter, Path, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Path, HTTPException, status, Query
+from fastapi.responses import JSONResponse, Response
 
 from fastmda import schemas
-from fastmda.database import SessionLocal
 from fastmda.exceptions import *
 from fastmda.globals import device_dict
-from fastmda.objects import DiscreteActuator, ContinuousActuator
+from fastmda.objects import AbstractDevice, DiscreteActuator, ContinuousActuator, DiscreteSetting, ContinuousSetting
+from fastmda.routers import info_list_response, set_setting_value, set_timeout, get_timeout
 
 router = APIRouter(
     prefix="/devices/{device_id}/actuators",
     tags=["actuators"]
 )
-responses = {
+# Responses of the routes besides the successful one, combined per route in the route decorators.
+_DEVICE_NOT_FOUND = {
+    status.HTTP_404_NOT_FOUND: {
+        "model": schemas.Detail,
+        "description": "Device with given ID not found."
+    }
+}
+_ACTUATOR_NOT_FOUND = {
+    status.HTTP_404_NOT_FOUND: {
+        "model": schemas.Detail,
+        "description": "Device and/or actuator with given ID not found."
+    }
+}
+_SETTING_NOT_FOUND = {
     status.HTTP_404_NOT_FOUND: {
         "model": schemas.Detail,
         "description": "Device, actuator and/or setting with given ID not found."
-    },
+    }
+}
+_GET_ERRORS = {
+    status.HTTP_504_GATEWAY_TIMEOUT: {
+        "model": schemas.Detail,
+        "description": "The value could not be read within the set timeout."
+    }
+}
+_SET_ERRORS = {
     status.HTTP_504_GATEWAY_TIMEOUT: {
         "model": schemas.Detail,
-        "description": "The set or get of a value could not be performed within the set timeout."
+        "description": "The value could not be set within the set timeout."
     },
     status.HTTP_406_NOT_ACCEPTABLE: {
         "model": schemas.Detail,
-        "description": "The value to set was not accepted."
+        "description": "The value to set was not within the set limits."
     },
     status.HTTP_423_LOCKED: {
         "model": schemas.Detail,
         "description": "The device is busy."
     }
 }
-set_timeout = 5
-get_timeout = 0.1
 
 
-# Dependency
-def get_db():
-    db = SessionLocal()
+async def _get_device(device_id: int = Path(..., description="The ID of the device.")) -> AbstractDevice:
+    """
+    Dependency resolving the device of the device ID in the path.
+
+    :param device_id: The ID of the device.
+    :type device_id: int
+    :return: The device with the ID.
+    :rtype: AbstractDevice
+    :raises HTTPException: 404 if there is no device with the ID.
+    """
+    device = device_dict.get(device_id)
+    if device is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
+    return device
+
+
+async def _get_actuator(actuator_id: int = Path(..., description="The ID of the actuator."),
+                        device: AbstractDevice = Depends(_get_device)) -> Union[DiscreteActuator, ContinuousActuator]:
+    """
+    Dependency resolving the actuator of the device and actuator IDs in the path.
+
+    :param actuator_id: The ID of the actuator.
+    :type actuator_id: int
+    :param device: The device of the actuator.
+    :type device: AbstractDevice
+    :return: The actuator with the ID.
+    :rtype: Union[DiscreteActuator, ContinuousActuator]
+    :raises HTTPException: 404 if there is no actuator with the ID.
+    """
+    actuator = device.actuators.get(actuator_id)
+    if actuator is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
+    return actuator
+
+
+async def _get_setting(setting_id: int = Path(..., description="The ID of the setting."),
+                       actuator: Union[DiscreteActuator, ContinuousActuator] = Depends(_get_actuator)
+                       ) -> Union[DiscreteSetting, ContinuousSetting]:
+    """
+    Dependency resolving the actuator setting of the device, actuator and setting IDs in the path.
+
+    :param setting_id: The ID of the setting.
+    :type setting_id: int
+    :param actuator: The actuator of the setting.
+    :type actuator: Union[DiscreteActuator, ContinuousActuator]
+    :return: The setting with the ID.
+    :rtype: Union[DiscreteSetting, ContinuousSetting]
+    :raises HTTPException: 404 if there is no actuator setting with the ID.
+    """
+    setting = actuator.settings.get(setting_id)
+    if setting is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator setting with ID {setting_id}.")
+    return setting
+
+
+async def _set_actuator_value(actuator: Union[DiscreteActuator, ContinuousActuator],
+                              value: Union[int, float]) -> Union[str, float]:
+    """
+    Help function for setting the value of an actuator and getting the new value, shared by the single and the batch set
+    routes.
+
+    :param actuator: The actuator to set the value of.
+    :type actuator: Union[DiscreteActuator, ContinuousActuator]
+    :param value: The value to set the actuator to, the index of the value for discrete actuators.
+    :type value: Union[int, float]
+    :return: The value of the actuator after it was set.
+    :rtype: Union[str, float]
+    :raises HTTPException: 406 if the value is outside the limits, 423 if the device is busy and 504 if the value could
+        not be set or read back within the timeouts.
+    """
     try:
-        yield db
-    finally:
-        db.close()
+        new_value = await asyncio.wait_for(actuator.set_value(value), timeout=set_timeout)
+        if new_value is not None:
+            return new_value
+        try:
+            return await asyncio.wait_for(actuator.get_value(), timeout=get_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                                detail=f"The set could not be read within the timeout of {get_timeout} s.")
+    except FastMDAisBusy:
+        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
+    except FastMDAatHardwareLimit:
+        if isinstance(actuator, DiscreteActuator):
+            raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                                detail=f"The value index {value} is outside the options of the actuator " +
+                                       f"{actuator.get_value_options()}")
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                            detail=f"The value of {value} is outside the hardware limits of the actuator " +
+                                   f"{actuator.get_cached_hard_limits().to_optional()}")
+    except FastMDAatSoftwareLimit:
+        if isinstance(actuator, DiscreteActuator):
+            raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                                detail=f"The value index {value} is temporarily invalid for the actuator.")
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                            detail=f"The value of {value} is outside the software limits of the actuator " +
+                                   f"{actuator.get_soft_limits()}")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                            detail=f"The value of {value} could not be set within the timeout of {set_timeout} s.")
 
 
 @router.get("/discrete", response_model=List[schemas.DiscreteActuatorInfo], summary="Get all discrete actuators",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device with given ID not found."
-                }
-            })
-async def get_all_discrete_actuators(device_id: int = Path(..., description="The ID of the device.")):
+            responses=_DEVICE_NOT_FOUND)
+async def get_all_discrete_actuators(device: AbstractDevice = Depends(_get_device)):
     """
     Get a list of information for all discrete actuators of the specified device.
     """
-    try:
-        return [act.info for _, act in device_dict[device_id].actuators.items() if isinstance(act, DiscreteActuator)]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
+    return info_list_response(device.discrete_actuators.values())
 
 
 @router.get("/continuous", response_model=List[schemas.ContinuousActuatorInfo], summary="Get all continuous actuators",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device with given ID not found."
-                }
-            })
-async def get_all_continuous_actuators(device_id: int = Path(..., description="The ID of the device.")):
+            responses=_DEVICE_NOT_FOUND)
+async def get_all_continuous_actuators(device: AbstractDevice = Depends(_get_device)):
     """
     Get a list of information for all continuous actuators of the specified device.
     """
-    try:
-        return [act.info for _, act in device_dict[device_id].actuators.items() if isinstance(act, ContinuousActuator)]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
+    return info_list_response(device.continuous_actuators.values())
+
+
+@router.put("/values", response_model=List[schemas.ActuatorValueResult], summary="Set multiple actuator values",
+            responses=_DEVICE_NOT_FOUND)
+async def set_actuator_values(values: List[schemas.ActuatorValue], device: AbstractDevice = Depends(_get_device)):
+    """
+    Set the values of several actuators of the specified device in one request, e.g. for all the actuators of a scan
+    step. The values are set one after the other in the given order, since the device only sets one value at a time.
+    The result of each set is reported with the status code and detail that the single set would have responded with.
+    There is no timeout for the whole batch: each set gets its own set timeout (and read back timeout), so a batch of
+    N values can take up to N times the set timeout to respond.
+    """
+    actuators = device.actuators
+    results = []
+    for actuator_value in values:
+        actuator_id = actuator_value.actuator_id
+        actuator = actuators.get(actuator_id)
+        if actuator is None:
+            results.append(schemas.ActuatorValueResult(actuator_id=actuator_id,
+                                                       status_code=status.HTTP_404_NOT_FOUND,
+                                                       detail=f"No actuator with ID {actuator_id}."))
+            continue
+        try:
+            new_value = await _set_actuator_value(actuator, actuator_value.value)
+        except HTTPException as e:
+            results.append(schemas.ActuatorValueResult(actuator_id=actuator_id, status_code=e.status_code,
+                                                       detail=e.detail))
+        else:
+            results.append(schemas.ActuatorValueResult(actuator_id=actuator_id, status_code=status.HTTP_200_OK,
+                                                       value=new_value))
+    return results
 
 
 @router.get("/{actuator_id}", response_model=Union[schemas.DiscreteActuatorInfo, schemas.ContinuousActuatorInfo],
             summary="Get actuator information",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device and/or actuator with given ID not found."
-                }
-            })
-async def get_actuator(device_id: int = Path(..., description="The ID of the device."),
-                       actuator_id: int = Path(..., description="The ID of the actuator.")):
+            responses=_ACTUATOR_NOT_FOUND)
+async def get_actuator(actuator: Union[DiscreteActuator, ContinuousActuator] = Depends(_get_actuator)):
     """
     Get the information for the specified actuator of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return device.actuators[actuator_id].info
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
+    return Response(actuator.info_json(), media_type="application/json")
 
 
 @router.get("/{actuator_id}/value", response_model=Union[str, float], summary="Get actuator value",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device and/or actuator with given ID not found."
-                },
-                status.HTTP_504_GATEWAY_TIMEOUT: {
-                    "model": schemas.Detail,
-                    "description": "The value could not be read within the set timeout."
-                }
-            })
-async def get_actuator_value(device_id: int = Path(..., description="The ID of the device."),
-                             actuator_id: int = Path(..., description="The ID of the actuator.")):
+            responses={**_ACTUATOR_NOT_FOUND, **_GET_ERRORS})
+async def get_actuator_value(actuator: Union[DiscreteActuator, ContinuousActuator] = Depends(_get_actuator)):
     """
     Get the value for the specified actuator of the specified device.
     """
     try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return await asyncio.wait_for(device.actuators[actuator_id].get_value(), timeout=get_timeout)
+        return JSONResponse(await asyncio.wait_for(actuator.read_value(), timeout=get_timeout))
     except asyncio.TimeoutError:
         raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
                             detail=f"The value could not be read within the timeout of {get_timeout} s.")
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
 
 
 @router.put("/{actuator_id}/value", response_model=Union[str, float], summary="Set actuator value",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device and/or actuator with given ID not found."
-                },
-                status.HTTP_504_GATEWAY_TIMEOUT: {
-                    "model": schemas.Detail,
-                    "description": "The value could not be set within the set timeout."
-                },
-                status.HTTP_406_NOT_ACCEPTABLE: {
-                    "model": schemas.Detail,
-                    "description": "The value to set was not within the set limits."
-                },
-                status.HTTP_423_LOCKED: {
-                    "model": schemas.Detail,
-                    "description": "The device is busy."
-                }
-            })
+            responses={**_ACTUATOR_NOT_FOUND, **_SET_ERRORS})
 async def set_actuator_value(value: Union[int, float] = Query(..., description="The value to set the actuator to."),
-                             device_id: int = Path(..., description="The ID of the device."),
-                             actuator_id: int = Path(..., description="The ID of the actuator.")):
+                             actuator: Union[DiscreteActuator, ContinuousActuator] = Depends(_get_actuator)):
     """
     Set the value for the specified actuator of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        await asyncio.wait_for(device.actuators[actuator_id].set_value(value), timeout=set_timeout)
-        try:
-            return await asyncio.wait_for(device.actuators[actuator_id].get_value(), timeout=get_timeout)
-        except asyncio.TimeoutError:
-            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                                detail=f"The set could not be read within the timeout of {get_timeout} s.")
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
-    except FastMDAisBusy:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
-    except FastMDAatHardSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the hard limits of the setting " +
-                                   f"{device.actuators[actuator_id].get_hard_limits()}")
-    except FastMDAatSoftSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the soft limits of the setting " +
-                                   f"{device.actuators[actuator_id].get_soft_limits()}")
-    except asyncio.TimeoutError:
-        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                            detail=f"The value of {value} could not be set within the timeout of {set_timeout} s.")
+    return JSONResponse(await _set_actuator_value(actuator, value))
 
 
 @router.get("/{actuator_id}/settings",
             response_model=List[Union[schemas.DiscreteSettingInfo, schemas.ContinuousSettingInfo]],
             summary="Get all actuator settings",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device and/or actuator with given ID not found."
-                }
-            })
-async def get_all_actuator_settings(device_id: int = Path(..., description="The ID of the device."),
-                                    actuator_id: int = Path(..., description="The ID of the actuator.")):
+            responses=_ACTUATOR_NOT_FOUND)
+async def get_all_actuator_settings(actuator: Union[DiscreteActuator, ContinuousActuator] = Depends(_get_actuator)):
     """
     Get a list of information on all the settings for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return [setting.info for _, setting in device.actuators[actuator_id].settings.items()]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
+    return info_list_response(actuator.settings.values())
 
 
 @router.get("/{actuator_id}/setting/{setting_id}",
             response_model=Union[schemas.DiscreteSettingInfo, schemas.ContinuousSettingInfo],
             summary="Get actuator setting information",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device, actuator and/or setting with given ID not found."
-                }
-            })
-async def get_actuator_setting(device_id: int = Path(..., description="The ID of the device."),
-                               actuator_id: int = Path(..., description="The ID of the actuator."),
-                               setting_id: int = Path(..., description="The ID of the setting.")):
+            responses=_SETTING_NOT_FOUND)
+async def get_actuator_setting(setting: Union[DiscreteSetting, ContinuousSetting] = Depends(_get_setting)):
     """
     Get the setting information for the specified setting for the specified actuator of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        actuator = device.actuators[actuator_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
-    try:
-        return actuator.settings[setting_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator setting with ID {setting_id}.")
+    return Response(setting.info_json(), media_type="application/json")
 
 
 @router.get("/{actuator_id}/setting/{setting_id}/value", response_model=Union[str, float],
             summary="Get actuator setting value",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device, actuator and/or setting with given ID not found."
-                },
-                status.HTTP_504_GATEWAY_TIMEOUT: {
-                    "model": schemas.Detail,
-                    "description": "The value could not be read within the set timeout."
-                }
-            })
-async def get_actuator_setting_value(device_id: int = Path(..., description="The ID of the device."),
-                                     actuator_id: int = Path(..., description="The ID of the actuator."),
-                                     setting_id: int = Path(..., description="The ID of the setting.")):
+            responses={**_SETTING_NOT_FOUND, **_GET_ERRORS})
+async def get_actuator_setting_value(setting: Union[DiscreteSetting, ContinuousSetting] = Depends(_get_setting)):
     """
     Get the setting value for the specified setting for the specified actuator of the specified device.
     """
     try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        actuator = device.actuators[actuator_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
-    try:
-        return await asyncio.wait_for(actuator.settings[setting_id].get_value(), timeout=set_timeout)
+        return JSONResponse(await asyncio.wait_for(setting.read_value(), timeout=set_timeout))
     except asyncio.TimeoutError:
         raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
                             detail=f"The value could not be read within the timeout of {get_timeout} s.")
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator setting with ID {setting_id}.")
 
 
 @router.put("/{actuator_id}/setting/{setting_id}/value", response_model=Union[str, float],
             summary="Set actuator setting value",
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    "model": schemas.Detail,
-                    "description": "Device, actuator and/or setting with given ID not found."
-                },
-                status.HTTP_504_GATEWAY_TIMEOUT: {
-                    "model": schemas.Detail,
-                    "description": "The value could not be set within the set timeout."
-                },
-                status.HTTP_406_NOT_ACCEPTABLE: {
-                    "model": schemas.Detail,
-                    "description": "The value to set was not within the set limits."
-                },
-                status.HTTP_423_LOCKED: {
-                    "model": schemas.Detail,
-                    "description": "The device is busy."
-                }
-            })
+            responses={**_SETTING_NOT_FOUND, **_SET_ERRORS})
 async def set_actuator_setting_value(
         value: Union[int, float] = Query(..., description="The value to set the setting to."),
-        device_id: int = Path(..., description="The ID of the device."),
-        actuator_id: int = Path(..., description="The ID of the actuator."),
-        setting_id: int = Path(..., description="The ID of the setting.")
+        setting: Union[DiscreteSetting, ContinuousSetting] = Depends(_get_setting)
 ):
     """
     Set the setting value for the specified setting for the specified actuator of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        actuator = device.actuators[actuator_id]
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator with ID {actuator_id}.")
-    try:
-        await asyncio.wait_for(actuator.settings[setting_id].set_value(value), timeout=set_timeout)
-        try:
-            return await asyncio.wait_for(actuator.settings[setting_id].get_value(), timeout=set_timeout)
-        except asyncio.TimeoutError:
-            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                                detail=f"The set could not be read within the timeout of {get_timeout} s.")
-    except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No actuator setting with ID {setting_id}.")
-    except FastMDAisBusy:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
-    except FastMDAatHardSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the hard limits of the setting " +
-                                   f"{actuator.settings[setting_id].get_hard_limits()}")
-    except FastMDAatSoftSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the soft limits of the setting " +
-                                   f"{actuator.settings[setting_id].get_soft_limits()}")
-    except asyncio.TimeoutError:
-        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                            detail=f"The value of {value} could not be set within the timeout of {set_timeout} s.")
+    return JSONResponse(await set_setting_value(setting, value))
@@ -1,10 +1,12 @@
 from typing import List, Union
 
 from fastapi import APIRouter, Path, HTTPException, status, Query
+from fastapi.responses import JSONResponse, Response
 
 from fastmda import schemas
 from fastmda.exceptions import *
 from fastmda.globals import device_dict
+from fastmda.routers import info_list_response, set_setting_value
 
 router = APIRouter(
     prefix="/devices/{device_id}/detectors",
@@ -17,10 +19,10 @@ async def get_all_detectors(device_id: int = Path(..., description="The ID of th
     """
     Get a list of information for all the added detector instances for the specified device.
     """
-    try:
-        return [det.info for _, det in device_dict[device_id].detectors.items()]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
+    return info_list_response(device.detectors.values())
 
 
 @router.get("/{detector_id}", response_model=schemas.DetectorInfo, summary="Get detector information")
@@ -29,14 +31,13 @@ async def get_detector(device_id: int = Path(..., description="The ID of the dev
     """
     Get the information for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return device.detectors[detector_id].info
-    except KeyError:
+    detector = device.detectors.get(detector_id)
+    if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector with ID {detector_id}.")
+    return Response(detector.info_json(), media_type="application/json")
 
 
 @router.get("/{detector_id}/settings",
@@ -47,14 +48,13 @@ async def get_all_detector_settings(device_id: int = Path(..., description="The
     """
     Get a list of information on all the settings for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return [setting.info for _, setting in device.detectors[detector_id].settings]
-    except KeyError:
+    detector = device.detectors.get(detector_id)
+    if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector with ID {detector_id}.")
+    return info_list_response(detector.settings.values())
 
 
 @router.get("/{detector_id}/setting/{setting_id}",
@@ -66,18 +66,16 @@ async def get_detector_setting(device_id: int = Path(..., description="The ID of
     """
     Get the setting information for the specified setting for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        detector = device.detectors[detector_id]
-    except KeyError:
+    detector = device.detectors.get(detector_id)
+    if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector with ID {detector_id}.")
-    try:
-        return detector.settings[setting_id]
-    except KeyError:
+    setting = detector.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector setting with ID {setting_id}.")
+    return Response(setting.info_json(), media_type="application/json")
 
 
 @router.get("/{detector_id}/setting/{setting_id}/value", response_model=Union[str, float],
@@ -88,18 +86,16 @@ async def get_detector_setting_value(device_id: int = Path(..., description="The
     """
     Get the setting value for the specified setting for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        detector = device.detectors[detector_id]
-    except KeyError:
+    detector = device.detectors.get(detector_id)
+    if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector with ID {detector_id}.")
-    try:
-        return detector.settings[setting_id].get_value()
-    except KeyError:
+    setting = detector.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector setting with ID {setting_id}.")
+    return JSONResponse(await setting.read_value())
 
 
 @router.put("/{detector_id}/setting/{setting_id}/value", response_model=Union[str, float],
@@ -113,26 +109,13 @@ async def set_detector_setting_value(
     """
     Set the setting value for the specified setting for the specified detector of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        detector = device.detectors[detector_id]
-    except KeyError:
+    detector = device.detectors.get(detector_id)
+    if detector is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector with ID {detector_id}.")
-    try:
-        detector.settings[setting_id].set_value(value)
-        return detector.settings[setting_id].get_value()
-    except KeyError:
+    setting = detector.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No detector setting with ID {setting_id}.")
-    except FastMDAisBusy:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
-    except FastMDAatHardSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the hard limits of the setting " +
-                                   f"{detector.settings[setting_id].get_hard_limits()}")
-    except FastMDAatSoftSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the soft limits of the setting " +
-                                   f"{detector.settings[setting_id].get_soft_limits()}")
+    return JSONResponse(await set_setting_value(setting, value))
@@ -1,21 +1,33 @@
-from typing import Dict, List, Union
+import json
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Union
 
 from fastapi import APIRouter, Path, HTTPException, status, Depends, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 
 from fastmda import crud, schemas
 from fastmda.database import SessionLocal
+from fastmda.device_types import load_device_type, load_all_device_types
 from fastmda.exceptions import *
-from fastmda.globals import device_dict, device_types_info, device_types_modules
+from fastmda.globals import device_dict
+from fastmda.objects import AbstractDevice
+from fastmda.routers import info_list_response, set_setting_value
 from fastmda.schemas import DeviceInfo, DeviceType, DeviceInfoCreate
 
 router = APIRouter(
     prefix="/devices",
     tags=["devices"]
 )
+logger = logging.getLogger(__name__)
+# The available device types do not change while the server is running, so they are serialized on the first request.
+# The route is a plain function so that importing the device type modules does not block the event loop.
+_device_types_json = None
 
 
-# Dependency
+# Dependency. The routes using the session are plain functions, which FastAPI runs in its thread pool so that the
+# blocking database calls (and the connect and disconnect calls of the devices) do not block the event loop.
 def get_db():
     db = SessionLocal()
     try:
@@ -24,8 +36,25 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def _device_lock(device: AbstractDevice) -> Iterator[None]:
+    """
+    Help context manager for holding the busy lock of a device while connecting or disconnecting it.
+
+    :param device: The device to lock.
+    :type device: AbstractDevice
+    :raises HTTPException: With status 423 if the device is already busy.
+    """
+    if not device.busy_lock.acquire(blocking=False):
+        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="The device is busy.")
+    try:
+        yield
+    finally:
+        device.busy_lock.release()
+
+
 @router.get("/", response_model=List[DeviceInfo], summary="Get all device instances")
-async def get_devices(db: Session = Depends(get_db)):
+def get_devices(db: Session = Depends(get_db)):
     """
     Get a list of information for all device instances.
     """
@@ -33,15 +62,20 @@ async def get_devices(db: Session = Depends(get_db)):
 
 
 @router.get("/device_types", response_model=Dict[str, DeviceType], summary="Get all device types")
-async def get_device_types():
+def get_device_types():
     """
     Get a list of all the device types that can be instantiated.
     """
-    return device_types_info
+    global _device_types_json
+    if _device_types_json is None:
+        _device_types_json = json.dumps(
+            {name: device_type.dict() for name, device_type in load_all_device_types().items()}, separators=(",", ":")
+        ).encode()
+    return Response(_device_types_json, media_type="application/json")
 
 
 @router.get("/{device_id}", response_model=DeviceInfo, summary="Get device information")
-async def get_device(device_id: int = Path(..., description="The id of the device"), db: Session = Depends(get_db)):
+def get_device(device_id: int = Path(..., description="The id of the device"), db: Session = Depends(get_db)):
     """
     Get the information for the specified device.
     """
@@ -53,62 +87,82 @@ async def get_device(device_id: int = Path(..., description="The id of the devic
 
 @router.post("/add_device", response_model=DeviceInfo, status_code=status.HTTP_201_CREATED,
              summary="Add a device instance")
-async def add_device(device_info: DeviceInfoCreate, db: Session = Depends(get_db)):
+def add_device(device_info: DeviceInfoCreate, db: Session = Depends(get_db)):
     """
     Add a new instance of a device.
     """
-    device_info_orm = crud.create_device_info(db, device_info)
-    device_info = DeviceInfo.from_orm(device_info_orm)
-    device_module = device_types_modules[device_info.device_type]
+    # The device type is resolved before the row is added, so that no row is stored for a device type that can not be
+    # loaded.
     try:
-        device_dict[device_info.id] = device_module.Device(device_info.id, **device_info.args)
-    except AttributeError:
-        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                            detail=f'{device_module.__name__} has not implemented a Device class.')
+        device_class = load_device_type(device_info.device_type)
+    except FastMDAModuleError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=f'No device type {device_info.device_type}.')
+    except FastMDAImplementationError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    # The ORM row is returned as it is and only validated once, against the response model.
+    device_info = crud.create_device_info(db, device_info)
+    try:
+        device_dict[device_info.id] = device_class(device_info.id, **device_info.args)
     except TypeError as e:
         raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                            detail=f'{device_module.__name__} has not implemented Device class according to spec. {e}')
+                            detail=f'{device_class.__module__} has not implemented Device class according to spec. {e}')
     return device_info
 
 
 @router.put("/{device_id}/connect", response_model=DeviceInfo, summary="Connect the device")
-async def connect_device(device_id: int = Path(..., description="The id of the device"), db: Session = Depends(get_db)):
+def connect_device(device_id: int = Path(..., description="The id of the device"), db: Session = Depends(get_db)):
     """
     Connect the specified device.
     """
-    device_info = crud.get_device_info(db, device_id)
-    if device_info is None:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Device not found")
+    device_info = None
     try:
-        if device_dict[device_id].connect():
-            return crud.update_device_connection_status(db, device_id, device_dict[device_id].is_connected())
+        with _device_lock(device):
+            if device.connect():
+                # Only a pre-build of the info (it is built on the first request otherwise), so it must not fail a
+                # connect.
+                try:
+                    device.cache_info()
+                except Exception:
+                    logger.exception("Failed to cache the info of device with ID %d.", device_id)
+                device_info = crud.update_device_connection_status(db, device_id, device.is_connected())
     except NotImplementedError:
         raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED,
                             detail="Device class has not implemented connect method")
     except FastMDAConnectFailed as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=e)
+    # The row is only read here if it was not returned by the status update.
+    if device_info is None:
+        device_info = crud.get_device_info(db, device_id)
     return device_info
 
 
 @router.put("/{device_id}/disconnect", response_model=DeviceInfo, summary="Disconnect the device")
-async def disconnect_device(device_id: int = Path(..., description="The id of the device"),
-                            db: Session = Depends(get_db)):
+def disconnect_device(device_id: int = Path(..., description="The id of the device"),
+                      db: Session = Depends(get_db)):
     """
     Disconnect the specified device.
     """
-    device_info = crud.get_device_info(db, device_id)
-    if device_info is None:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Device not found")
+    device_info = None
     try:
-        if device_dict[device_id].disconnect():
-            device_info = crud.update_device_connection_status(db, device_id, device_dict[device_id].is_connected())
+        with _device_lock(device):
+            if device.disconnect():
+                device_info = crud.update_device_connection_status(db, device_id, device.is_connected())
     except NotImplementedError:
         raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED,
                             detail="Device class has not implemented disconnect method")
     except FastMDAConnectFailed as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=e)
+    if device_info is None:
+        device_info = crud.get_device_info(db, device_id)
     return device_info
 
 
@@ -119,11 +173,10 @@ async def get_all_device_settings(device_id: int = Path(..., description="The ID
     """
     Get a list of information on all the settings for the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    return [setting.info for _, setting in device.settings]
+    return info_list_response(device.settings.values())
 
 
 @router.get("/{device_id}/setting/{setting_id}",
@@ -134,14 +187,13 @@ async def get_device_setting(device_id: int = Path(..., description="The ID of t
     """
     Get the setting information for the specified setting of the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return device.settings[setting_id]
-    except KeyError:
+    setting = device.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device setting with ID {setting_id}.")
+    return Response(setting.info_json(), media_type="application/json")
 
 
 @router.get("/{device_id}/setting/{setting_id}/value", response_model=Union[str, float],
@@ -151,14 +203,13 @@ async def get_device_setting_value(device_id: int = Path(..., description="The I
     """
     Get the setting value for the specified setting of the the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        return device.settings[setting_id].get_value()
-    except KeyError:
+    setting = device.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device setting with ID {setting_id}.")
+    return JSONResponse(await setting.read_value())
 
 
 @router.put("/{device_id}/setting/{setting_id}/value", response_model=Union[str, float],
@@ -171,22 +222,10 @@ async def set_device_setting_value(
     """
     Set the setting value for the specified setting of the the specified device.
     """
-    try:
-        device = device_dict[device_id]
-    except KeyError:
+    device = device_dict.get(device_id)
+    if device is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device with ID {device_id}.")
-    try:
-        device.settings[setting_id].set_value(value)
-        return device.settings[setting_id].get_value()
-    except KeyError:
+    setting = device.settings.get(setting_id)
+    if setting is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No device setting with ID {setting_id}.")
-    except FastMDAisBusy:
-        raise HTTPException(status_code=status.HTTP_423_LOCKED, detail=f"The device is busy.")
-    except FastMDAatHardSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the hard limits of the setting " +
-                                   f"{device.settings[setting_id].get_hard_limits()}")
-    except FastMDAatSoftSettingLimit:
-        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                            detail=f"The value of {value} is outside the soft limits of the setting " +
-                                   f"{device.settings[setting_id].get_soft_limits()}")
+    return JSONResponse(await set_setting_value(setting, value))
@@ -57,6 +57,23 @@ class ContinuousActuatorInfo(ActuatorInfo):
     )
 
 
+class ActuatorValue(BaseModel):
+    actuator_id: int = Field(..., description="Unique id of the actuator.")
+    value: Union[int, float] = Field(..., description="The value to set the actuator to, the index of the value for " +
+                                                      "discrete actuators.")
+
+
+class ActuatorValueResult(BaseModel):
+    actuator_id: int = Field(..., description="Unique id of the actuator.")
+    status_code: int = Field(..., description="The HTTP status code the set would have responded with on its own.")
+    value: Optional[Union[str, float]] = Field(None, description="The value of the actuator after it was set.")
+    detail: Optional[str] = Field(None, description="The error detail if the value could not be set.")
+
+    class Config:
+        # Keep float values of continuous actuators as floats instead of coercing them to str.
+        smart_union = True
+
+
 # Detector:
 
 class DetectorInfo(BaseModel):
@@ -0,0 +1,46 @@
+"""
+One-off upgrade of a database created by an older version of fastMDA, run with `python -m fastmda.upgrade_db` from the
+folder of the sql_app.db file while the server is stopped.
+"""
+import logging
+import pickle
+
+from sqlalchemy.orm import Session
+
+from fastmda import crud, models
+from fastmda.database import engine, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def convert_pickled_device_args(db: Session) -> int:
+    """
+    Function for converting the device arguments stored as pickled blobs by older versions to JSON. Rows that cannot be
+    unpickled or stored as JSON are logged and left as they are, so that they are skipped by the server.
+
+    :param db: The database session.
+    :type db: Session
+    :return: The number of devices whose arguments were converted.
+    :rtype: int
+    """
+    converted_rows = 0
+    for device_id, pickled_args in crud.get_pickled_device_args(db):
+        try:
+            crud.update_device_args(db, device_id, pickle.loads(pickled_args))
+        except Exception as e:
+            db.rollback()
+            logger.warning("Could not convert the arguments of device with ID %d: %s", device_id, e)
+            continue
+        converted_rows += 1
+    return converted_rows
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    models.Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        logger.info("Converted the pickled arguments of %d devices to JSON.", convert_pickled_device_args(db))
+
+
+if __name__ == "__main__":
+    main()
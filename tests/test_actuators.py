@@ -0,0 +1,62 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastmda.device_types.example_device import example_device
+from fastmda.globals import device_dict
+from fastmda.routers import actuators
+
+app = FastAPI()
+app.include_router(actuators.router)
+
+
+@pytest.fixture
+def device():
+    device_instance = example_device.Device(1, 'COM1')
+    device_dict[device_instance.device_id] = device_instance
+    yield device_instance
+    del device_dict[device_instance.device_id]
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_set_actuator_values(device, client):
+    response = client.put('/devices/1/actuators/values', json=[{'actuator_id': 1, 'value': 1}])
+    assert response.status_code == 200
+    assert response.json() == [{'actuator_id': 1, 'status_code': 200, 'value': 'on', 'detail': None}]
+    assert client.get('/devices/1/actuators/1/value').json() == 'on'
+
+
+def test_set_actuator_values_partial_failure(device, client):
+    response = client.put('/devices/1/actuators/values', json=[
+        {'actuator_id': 1, 'value': 5},
+        {'actuator_id': 1, 'value': 1},
+    ])
+    assert response.status_code == 200
+    failed, succeeded = response.json()
+    assert failed['status_code'] == 406
+    assert failed['value'] is None
+    assert 'outside the options' in failed['detail']
+    assert succeeded == {'actuator_id': 1, 'status_code': 200, 'value': 'on', 'detail': None}
+
+
+def test_set_actuator_values_unknown_ids(device, client):
+    response = client.put('/devices/1/actuators/values', json=[{'actuator_id': 99, 'value': 1}])
+    assert response.status_code == 200
+    assert response.json() == [
+        {'actuator_id': 99, 'status_code': 404, 'value': None, 'detail': 'No actuator with ID 99.'}
+    ]
+    response = client.put('/devices/99/actuators/values', json=[{'actuator_id': 1, 'value': 1}])
+    assert response.status_code == 404
+
+
+def test_set_actuator_values_busy(device, client):
+    with device.busy_lock:
+        response = client.put('/devices/1/actuators/values', json=[{'actuator_id': 1, 'value': 1}])
+    assert response.json() == [
+        {'actuator_id': 1, 'status_code': 423, 'value': None, 'detail': 'The device is busy.'}
+    ]
@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from fastmda import crud, models, schemas
+from fastmda.upgrade_db import convert_pickled_device_args
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _insert_pickled_device(db: Session, device_id: int, pickled_args: bytes):
+    db.execute(text("INSERT INTO device_info (id, name, device_type, args, is_connected) "
+                    "VALUES (:id, 'old', 'example_device', :args, 0)"), {"id": device_id, "args": pickled_args})
+    db.commit()
+
+
+def test_convert_pickled_device_args(db):
+    _insert_pickled_device(db, 1, pickle.dumps({"com_port": "COM1"}))
+    assert crud.get_pickled_device_ids(db) == [1]
+    assert convert_pickled_device_args(db) == 1
+    assert crud.get_pickled_device_ids(db) == []
+    assert crud.get_devices_args(db, [1]) == {1: {"com_port": "COM1"}}
+    assert convert_pickled_device_args(db) == 0
+
+
+def test_convert_corrupt_pickled_device_args(db):
+    _insert_pickled_device(db, 1, b"not a pickle")
+    _insert_pickled_device(db, 2, pickle.dumps({"com_port": "COM1"}))
+    assert convert_pickled_device_args(db) == 1
+    assert crud.get_pickled_device_ids(db) == [1]
+    assert crud.get_devices_args(db, [2]) == {2: {"com_port": "COM1"}}
+
+
+def _create_device(db: Session, name: str) -> models.DeviceInfo:
+    return crud.create_device_info(db, schemas.DeviceInfoCreate(device_type='example_device', name=name,
+                                                                 args={'com_port': 'COM1'}))
+
+
+def test_update_device_connection_status_returns_row(db):
+    assert db.get_bind().dialect.update_returning
+    device_id = _create_device(db, 'a').id
+    device_info = crud.update_device_connection_status(db, device_id, True)
+    assert device_info.id == device_id
+    assert device_info.is_connected is True
+    assert device_info.args == {'com_port': 'COM1'}
+    db.expire_all()
+    assert crud.get_device_info(db, device_id).is_connected is True
+
+
+def test_update_device_connection_status_missing_id(db):
+    assert crud.update_device_connection_status(db, 99, True) is None
+
+
+def test_update_device_connection_status_without_returning(db, monkeypatch):
+    monkeypatch.setattr(db.get_bind().dialect, 'update_returning', False)
+    device_id = _create_device(db, 'a').id
+    device_info = crud.update_device_connection_status(db, device_id, True)
+    assert device_info.id == device_id
+    assert device_info.is_connected is True
+    assert crud.update_device_connection_status(db, device_id, False).is_connected is False
+    assert crud.update_device_connection_status(db, 99, True) is None
+
+
+def test_update_devices_connection_status(db):
+    device_ids = [_create_device(db, name).id for name in ('a', 'b', 'c')]
+    crud.update_device_connection_status(db, device_ids[1], True)
+    statuses = {device_ids[0]: True, device_ids[1]: False}
+    assert crud.update_devices_connection_status(db, statuses) == 2
+    db.expire_all()
+    assert [crud.get_device_info(db, device_id).is_connected for device_id in device_ids] == [True, False, False]
+    assert crud.update_devices_connection_status(db, {}) == 0
+    assert crud.update_devices_connection_status(db, {99: True}) == 0
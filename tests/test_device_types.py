@@ -0,0 +1,83 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fastmda import crud, device_types, models
+from fastmda.device_types.example_device import example_device
+from fastmda.exceptions import FastMDAImplementationError, FastMDAModuleError
+from fastmda.globals import device_types_info
+from fastmda.routers import devices
+
+app = FastAPI()
+app.include_router(devices.router)
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+models.Base.metadata.create_all(bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[devices.get_db] = override_get_db
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(devices, '_device_types_json', None)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_get_device_types(client, monkeypatch):
+    calls = []
+
+    def load_all_device_types():
+        calls.append(None)
+        return device_types.load_all_device_types()
+
+    monkeypatch.setattr(devices, 'load_all_device_types', load_all_device_types)
+    response = client.get('/devices/device_types')
+    assert response.status_code == 200
+    assert response.json()['example_device']['name'] == 'Example device'
+    assert client.get('/devices/device_types').json() == response.json()
+    assert len(calls) == 1
+
+
+def test_load_all_device_types_skips_broken_types(monkeypatch, caplog):
+    def load_device_type(device_type):
+        raise FastMDAModuleError(device_type)
+
+    monkeypatch.setattr(device_types, 'load_device_type', load_device_type)
+    assert device_types.load_all_device_types() is device_types_info
+    assert 'Skipping device type example_device' in caplog.text
+
+
+def _device_count() -> int:
+    with TestingSessionLocal() as db:
+        return len(crud.get_device_infos(db))
+
+
+def test_add_device_unknown_type(client):
+    response = client.post('/devices/add_device', json={'device_type': 'no_device', 'name': 'x', 'args': {}})
+    assert response.status_code == 422
+    assert response.json() == {'detail': 'No device type no_device.'}
+    assert _device_count() == 0
+
+
+def test_add_device_broken_type(client, monkeypatch):
+    def load_device_type(device_type):
+        raise FastMDAImplementationError(example_device, "Does not subclass AbstractDevice.")
+
+    monkeypatch.setattr(devices, 'load_device_type', load_device_type)
+    response = client.post('/devices/add_device', json={'device_type': 'example_device', 'name': 'x', 'args': {}})
+    assert response.status_code == 501
+    assert 'not implemented according to spec' in response.json()['detail']
+    assert _device_count() == 0
@@ -1,15 +1,62 @@
-from fastmda.exceptions import FastMDAConnectFailed
-from fastmda.device_types import example_device
+import asyncio
+
+import pytest
+
+from fastmda.exceptions import FastMDAConnectFailed, FastMDAisBusy
+from fastmda.device_types.example_device import example_device
 
 
 def test_example_device():
-    device_instance = example_device.Device('COM1')
-    print(device_instance.id)
-    print(device_instance.get_detectors())
-    try:
+    device_instance = example_device.Device(1, 'COM1')
+    assert device_instance.device_id == 1
+    assert dict(device_instance.detectors) == {}
+    assert device_instance.connect()
+    assert device_instance.is_connected()
+
+
+def test_example_device_connect_failed():
+    device_instance = example_device.Device(1, 'COM2')
+    with pytest.raises(FastMDAConnectFailed, match='COM2, invalid com port.'):
         device_instance.connect()
-    except FastMDAConnectFailed as e:
-        print(e)
+    assert not device_instance.is_connected()
+
+
+def test_set_value_exclusively():
+    device_instance = example_device.Device(1, 'COM1')
+    actuator = device_instance.actuators[1]
+    delay = actuator.settings[1]
+
+    async def set_concurrently():
+        await delay.set_value(0.01)
+        first_set = asyncio.ensure_future(actuator.set_value(1))
+        await asyncio.sleep(0)
+        with pytest.raises(FastMDAisBusy):
+            await actuator.set_value(0)
+        await first_set
+        return await actuator.read_value()
+
+    assert asyncio.run(set_concurrently()) == 'on'
+    assert not device_instance.busy_lock.locked()
+
+
+class SettingActuator(example_device.MyActuator):
+
+    __slots__ = ()
+
+    async def _set_value(self, value_index: int) -> str:
+        await self.settings[1].set_value(0.)
+        return await super()._set_value(value_index)
+
+
+def test_set_value_nested():
+    device_instance = example_device.Device(1, 'COM1')
+    actuator = SettingActuator(2, device_instance)
+
+    async def set_nested():
+        return await actuator.set_value(1), await device_instance.actuators[1].set_value(1)
+
+    assert asyncio.run(set_nested()) == ('on', 'on')
+    assert not device_instance.busy_lock.locked()
 
 
 def main():
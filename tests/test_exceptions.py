@@ -0,0 +1,59 @@
+import pickle
+
+import pytest
+
+from fastmda.exceptions import FastMDAatHardSettingLimit, FastMDAatHardwareLimit, FastMDAatSoftSettingLimit, \
+    FastMDAatSoftwareLimit
+from fastmda.schemas import ActuatorInfo, SettingInfo
+
+ACTUATOR_INFO = ActuatorInfo(name='Stage', actuator_id=1, device_id=2)
+SETTING_INFO = SettingInfo(name='Delay', setting_id=3, parent_id=1, grandparent_id=2)
+
+
+def test_actuator_limit_info_factory():
+    calls = []
+
+    def actuator_info_factory():
+        calls.append(None)
+        return ACTUATOR_INFO
+
+    exception = FastMDAatSoftwareLimit(message='Too far.', actuator_info_factory=actuator_info_factory)
+    assert calls == []
+    assert str(exception) == 'Actuator Stage with id 1 of device 2 at software limit. Too far.'
+    assert exception.actuator_info is ACTUATOR_INFO
+    assert exception.args == (ACTUATOR_INFO, 'Too far.')
+    assert repr(exception) == f'FastMDAatSoftwareLimit({ACTUATOR_INFO!r}, {"Too far."!r})'
+    assert len(calls) == 1
+
+
+def test_setting_limit_info_factory():
+    exception = FastMDAatSoftSettingLimit(setting_info_factory=lambda: SETTING_INFO)
+    assert exception.setting_info is SETTING_INFO
+    assert str(exception) == 'Setting Delay with ID 3 with parent ID 1 (with possible grandparent ID 2) at soft limit. '
+    assert exception.args == (SETTING_INFO, '')
+
+
+def test_limit_info_given_directly():
+    exception = FastMDAatHardwareLimit(ACTUATOR_INFO, 'Stuck.')
+    assert exception.actuator_info is ACTUATOR_INFO
+    assert 'at hardware limit. Stuck.' in str(exception)
+    unpickled = pickle.loads(pickle.dumps(exception))
+    assert unpickled.args == exception.args
+
+
+def test_limit_with_factory_pickles_resolved_info():
+    exception = FastMDAatHardSettingLimit(setting_info_factory=lambda: SETTING_INFO)
+    assert pickle.loads(pickle.dumps(exception)).setting_info == SETTING_INFO
+
+
+@pytest.mark.parametrize('exception_class, info, info_name', [
+    (FastMDAatSoftwareLimit, ACTUATOR_INFO, 'actuator_info'),
+    (FastMDAatHardwareLimit, ACTUATOR_INFO, 'actuator_info'),
+    (FastMDAatHardSettingLimit, SETTING_INFO, 'setting_info'),
+    (FastMDAatSoftSettingLimit, SETTING_INFO, 'setting_info'),
+])
+def test_limit_requires_exactly_one_info_argument(exception_class, info, info_name):
+    with pytest.raises(TypeError, match=f'Exactly one of {info_name} and {info_name}_factory'):
+        exception_class()
+    with pytest.raises(TypeError, match=f'Exactly one of {info_name} and {info_name}_factory'):
+        exception_class(info, **{f'{info_name}_factory': lambda: info})
@@ -0,0 +1,243 @@
+import asyncio
+from math import inf, nan
+
+import numpy as np
+import pytest
+from xarray import DataArray
+
+from fastmda import schemas
+from fastmda.device_types.example_device import example_device
+from fastmda.exceptions import FastMDAatHardSettingLimit, FastMDAatHardwareLimit
+from fastmda.objects import ContinuousActuator, Detector, Limits
+
+
+class HangingSetting(example_device.DelaySetting):
+
+    __slots__ = ('get_value_calls', 'release')
+
+    def __init__(self, setting_id, parent):
+        super().__init__(setting_id, parent)
+        self.get_value_calls = 0
+        self.release = None
+
+    async def get_value(self) -> float:
+        self.get_value_calls += 1
+        await self.release.wait()
+        return self.get_value_calls
+
+
+def _hanging_setting() -> HangingSetting:
+    return HangingSetting(2, example_device.Device(1, 'COM1'))
+
+
+def test_read_value_coalesces_concurrent_reads():
+    setting = _hanging_setting()
+
+    async def read_concurrently():
+        setting.release = asyncio.Event()
+        reads = [asyncio.ensure_future(setting.read_value()) for _ in range(3)]
+        await asyncio.sleep(0)
+        setting.release.set()
+        return await asyncio.gather(*reads)
+
+    assert asyncio.run(read_concurrently()) == [1, 1, 1]
+    assert setting.get_value_calls == 1
+
+
+def test_read_value_retries_after_timeout():
+    setting = _hanging_setting()
+
+    async def time_out_then_read():
+        setting.release = asyncio.Event()
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(setting.read_value(), timeout=0.01)
+        setting.release.set()
+        return await asyncio.wait_for(setting.read_value(), timeout=1)
+
+    assert asyncio.run(time_out_then_read()) == 3
+    assert setting.get_value_calls == 3
+
+
+def test_read_value_keeps_read_with_waiters():
+    setting = _hanging_setting()
+
+    async def time_out_one_read():
+        setting.release = asyncio.Event()
+        waiting_read = asyncio.ensure_future(setting.read_value())
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(setting.read_value(), timeout=0.01)
+        setting.release.set()
+        return await waiting_read
+
+    assert asyncio.run(time_out_one_read()) == 1
+    assert setting.get_value_calls == 1
+
+
+class Stage(ContinuousActuator):
+
+    __slots__ = ('_position',)
+
+    def __init__(self, actuator_id, parent):
+        super().__init__(actuator_id, parent)
+        self._position = 0.
+
+    @property
+    def name(self) -> str:
+        return "Stage"
+
+    @property
+    def unit(self) -> schemas.Unit:
+        return schemas.Unit()
+
+    @property
+    def settings(self):
+        return {}
+
+    def is_able_to_set(self) -> bool:
+        return True
+
+    def get_hard_limits(self):
+        return -10., None
+
+    async def get_value(self) -> float:
+        return self._position
+
+    async def _set_value(self, value: float) -> float:
+        self._position = value
+        return value
+
+
+def test_limits_from_optional():
+    assert Limits.from_optional((None, None)) == Limits(-inf, inf)
+    assert Limits.from_optional((-1, None)) == Limits(-1., inf)
+    assert Limits.from_optional((None, 2)).upper == 2.
+    assert isinstance(Limits.from_optional((0, 1)).lower, float)
+
+
+def test_limits_to_optional():
+    assert Limits().to_optional() == (None, None)
+    assert Limits(-1., inf).to_optional() == (-1., None)
+    assert Limits.from_optional((0., 1e3)).to_optional() == (0., 1e3)
+
+
+def test_values_within_limits():
+    setting = example_device.DelaySetting(1, example_device.Device(1, 'COM1'))
+    assert setting.values_within_limits([0., 500., 1e3])
+    assert not setting.values_within_limits([-1.])
+    assert not setting.values_within_limits([inf])
+    assert not setting.values_within_limits([nan])
+    setting.set_soft_limits((None, 10.))
+    assert setting.values_within_limits([0., 10.])
+    assert not setting.values_within_limits([0., 11.])
+
+
+def test_values_within_unbounded_limits():
+    stage = Stage(1, example_device.Device(1, 'COM1'))
+    assert stage.values_within_limits([-10., 1e300, inf])
+    assert not stage.values_within_limits([-inf])
+    assert not stage.values_within_limits([nan])
+
+
+def test_set_value_rejects_nan():
+    setting = example_device.DelaySetting(1, example_device.Device(1, 'COM1'))
+    stage = Stage(1, example_device.Device(1, 'COM1'))
+    with pytest.raises(FastMDAatHardSettingLimit):
+        setting.set_value(nan)
+    with pytest.raises(FastMDAatHardwareLimit):
+        stage.set_value(nan)
+    assert asyncio.run(stage.set_value(inf)) == inf
+
+
+def test_set_value_unchecked():
+    setting = example_device.DelaySetting(1, example_device.Device(1, 'COM1'))
+    stage = Stage(1, example_device.Device(1, 'COM1'))
+    points = [1., 2., 3.]
+    assert stage.values_within_limits(points)
+
+    async def scan():
+        return [await stage.set_value_unchecked(point) for point in points] + [await setting.set_value_unchecked(2e3)]
+
+    assert asyncio.run(scan()) == [1., 2., 3., 2e3]
+    assert asyncio.run(setting.get_value()) == 2e3
+
+
+class Spectrometer(Detector):
+
+    __slots__ = ('acquisitions',)
+
+    def __init__(self, detector_id, parent):
+        super().__init__(detector_id, parent)
+        self.acquisitions = 0
+
+    @property
+    def settings(self):
+        return {}
+
+    @property
+    def name(self) -> str:
+        return "Spectrometer"
+
+    def is_able_to_acquire(self) -> bool:
+        return True
+
+    def _acquire(self) -> DataArray:
+        self.acquisitions += 1
+        return DataArray(np.full(3, float(self.acquisitions)), dims=('wavelength',),
+                         coords={'wavelength': [400., 500., 600.]}, attrs={'units': 'counts'}, name='intensity')
+
+
+def _spectrometer() -> Spectrometer:
+    return Spectrometer(1, example_device.Device(1, 'COM1'))
+
+
+def test_acquire_batch_single():
+    batch = _spectrometer().acquire_batch(1)
+    assert batch.dims == ('acquisition', 'wavelength')
+    assert batch.shape == (1, 3)
+    assert batch.values.tolist() == [[1., 1., 1.]]
+
+
+def test_acquire_batch():
+    spectrometer = _spectrometer()
+    batch = spectrometer.acquire_batch(4)
+    assert spectrometer.acquisitions == 4
+    assert batch.dims == ('acquisition', 'wavelength')
+    assert batch.shape == (4, 3)
+    assert batch.coords['wavelength'].values.tolist() == [400., 500., 600.]
+    assert 'acquisition' not in batch.coords
+    assert batch.name == 'intensity'
+    assert batch.attrs == {'units': 'counts'}
+    assert batch.values[:, 0].tolist() == [1., 2., 3., 4.]
+
+
+@pytest.mark.parametrize('n', [0, -1])
+def test_acquire_batch_rejects_less_than_one(n):
+    spectrometer = _spectrometer()
+    with pytest.raises(ValueError):
+        spectrometer.acquire_batch(n)
+    assert spectrometer.acquisitions == 0
+
+
+def test_discrete_info_json_cache():
+    actuator = example_device.Device(1, 'COM1').actuators[1]
+    info_json = actuator.info_json()
+    assert actuator.info_json() is info_json
+    actuator.set_invalid_value(1)
+    invalid_info_json = actuator.info_json()
+    assert invalid_info_json is not info_json
+    assert b'"invalid_values":[1]' in invalid_info_json
+    assert actuator.info_json() is invalid_info_json
+    actuator._position_values.append("auto")
+    assert b'"auto"' in actuator.info_json()
+
+
+def test_continuous_info_json_cache():
+    setting = example_device.DelaySetting(1, example_device.Device(1, 'COM1'))
+    info_json = setting.info_json()
+    assert setting.info_json() is info_json
+    setting.set_soft_limits((None, 10.))
+    limited_info_json = setting.info_json()
+    assert limited_info_json is not info_json
+    assert b'"soft_limits":[null,10.0]' in limited_info_json
+    assert setting.info_json() is limited_info_json
@@ -0,0 +1,94 @@
+from types import MappingProxyType
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastmda import schemas
+from fastmda.device_types.example_device import example_device
+from fastmda.globals import device_dict
+from fastmda.objects import DiscreteSetting
+from fastmda.routers import actuators, devices
+
+app = FastAPI()
+app.include_router(devices.router)
+app.include_router(actuators.router)
+
+
+class ModeSetting(DiscreteSetting):
+
+    __slots__ = ('_mode',)
+
+    def __init__(self, setting_id, parent):
+        super().__init__(setting_id, parent)
+        self._mode = 0
+
+    @property
+    def name(self) -> str:
+        return "Mode"
+
+    @property
+    def unit(self) -> schemas.Unit:
+        return schemas.Unit()
+
+    def is_able_to_set(self) -> bool:
+        return True
+
+    async def get_value(self) -> str:
+        return self.get_value_options()[self._mode]
+
+    def get_value_options(self) -> List[str]:
+        return ["slow", "fast"]
+
+    async def _set_value(self, value_index: int) -> str:
+        self._mode = value_index
+        return self.get_value_options()[value_index]
+
+
+class ModeDevice(example_device.Device):
+
+    __slots__ = ('_settings',)
+
+    def __init__(self, device_id: int, com_port: str):
+        super().__init__(device_id, com_port)
+        self._settings = MappingProxyType({1: ModeSetting(1, self)})
+
+    @property
+    def settings(self):
+        return self._settings
+
+
+@pytest.fixture
+def client():
+    device_dict[1] = ModeDevice(1, 'COM1')
+    with TestClient(app) as test_client:
+        yield test_client
+    del device_dict[1]
+
+
+def test_set_discrete_setting_value(client):
+    response = client.put('/devices/1/setting/1/value', params={'value': 1})
+    assert response.status_code == 200
+    assert response.json() == 'fast'
+
+
+def test_set_discrete_setting_value_out_of_range(client):
+    response = client.put('/devices/1/setting/1/value', params={'value': 2})
+    assert response.status_code == 406
+    assert response.json() == {'detail': "The value index 2 is outside the options of the setting ['slow', 'fast']"}
+
+
+def test_set_discrete_setting_value_invalid(client):
+    device_dict[1].settings[1].set_invalid_value(1)
+    response = client.put('/devices/1/setting/1/value', params={'value': 1})
+    assert response.status_code == 406
+    assert response.json() == {'detail': "The value index 1 is temporarily invalid for the setting."}
+
+
+def test_set_continuous_setting_value_out_of_range(client):
+    response = client.put('/devices/1/actuators/1/setting/1/value', params={'value': 2e3})
+    assert response.status_code == 406
+    assert response.json() == {
+        'detail': "The value of 2000.0 is outside the hard limits of the setting (0.0, 1000.0)"
+    }